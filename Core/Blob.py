@@ -0,0 +1,100 @@
+import hashlib
+import os
+from Core.Directory import Directory
+from Core.File import File
+from Core.Framework import Framework
+
+class Blob(object):
+
+    @staticmethod
+    def collectGarbage():
+        count = 0
+        size = 0
+        blobDir = Blob.getDir()
+        if not Directory.exists(blobDir):
+            return {"Count": count, "Size": size}
+        for root, directories, names in os.walk(blobDir, topdown=False):
+            for name in names:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                if stat.st_nlink < 2:
+                    os.unlink(path)
+                    count += 1
+                    size += stat.st_size
+            if root != blobDir and len(os.listdir(root)) < 1:
+                os.rmdir(root)
+        return {"Count": count, "Size": size}
+
+    @staticmethod
+    def getDir():
+        return "{0}/__Blob__".format(Framework.getDataDir())
+
+    @staticmethod
+    def getPath(digest):
+        return "{0}/{1}/{2}".format(Blob.getDir(), digest[:2], digest)
+
+    @staticmethod
+    def link(blobPath, path):
+        tmpPath = File.getTempPath(path)
+        try:
+            if File.exists(path) and os.path.samefile(blobPath, path):
+                return True
+            File.delete(tmpPath)
+            os.link(blobPath, tmpPath)
+            os.replace(tmpPath, path)
+        except OSError:
+            File.delete(tmpPath)
+            return False
+        return True
+
+    @staticmethod
+    def __iterSlices(content):
+        for i in range(0, len(content), File.bufferSize):
+            chunk = content[i:i + File.bufferSize]
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+    @staticmethod
+    def __linkOrCopy(blobPath, path, mkdirs, durability):
+        if mkdirs:
+            Directory.make(File.getDirectory(path))
+        if not Blob.link(blobPath, path):
+            File.copy(blobPath, path, durability=durability)
+        elif File.getDurability(durability) == "fsync":
+            File.syncDirectory(File.getDirectory(path))
+
+    @staticmethod
+    def setContent(path, content, mkdirs=False, durability=None):
+        if not isinstance(content, (str, bytes)):
+            return File.setContent(path, content, mkdirs=mkdirs, durability=durability)
+        digest = hashlib.sha256()
+        for chunk in Blob.__iterSlices(content):
+            digest.update(chunk)
+        digest = digest.hexdigest()
+        blobPath = Blob.getPath(digest)
+        if not File.exists(blobPath):
+            File.setContentFromChunks(blobPath, Blob.__iterSlices(content), asBytes=True,
+                                      mkdirs=True, durability=durability)
+        Blob.__linkOrCopy(blobPath, path, mkdirs, durability)
+        return digest
+
+    @staticmethod
+    def setContentFromChunks(path, chunks, mkdirs=False, durability=None):
+        digest = hashlib.sha256()
+        def hashChunks():
+            for chunk in chunks:
+                data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                digest.update(data)
+                yield data
+        tmpPath = File.getTempPath("{0}/incoming".format(Blob.getDir()))
+        File.setContentFromChunks(tmpPath, hashChunks(), asBytes=True, mkdirs=True, durability="none")
+        if File.getDurability(durability) == "fsync":
+            File.syncFile(tmpPath)
+        digest = digest.hexdigest()
+        blobPath = Blob.getPath(digest)
+        if File.exists(blobPath):
+            File.delete(tmpPath)
+        else:
+            Directory.make(File.getDirectory(blobPath))
+            os.replace(tmpPath, blobPath)
+        Blob.__linkOrCopy(blobPath, path, mkdirs, durability)
+        return digest
@@ -1,11 +1,14 @@
-import copy
 import glob
 import inspect
 import json
 import os
 import re
 import sys
+import threading
+import time
+import types
 from pprint import pprint
+from Core.CfgSchema import CfgSchema
 from Core.Error import Error
 from Core.File import File
 from Core.Framework import Framework
@@ -17,6 +20,11 @@ class Cfg(object):
     def __init__(self, cfgPath):
         self.cfgPath = cfgPath
         self.cfg = None
+        self.cfgView = None
+        self.plugins = {}
+        self.pluginMethods = {}
+        self.pluginsByType = {}
+        self.workflowPlugins = {}
         self.installDir = Framework.getInstallDir()
         self.pluginTypes = ["IO", "Analyzer", "Translator", "Demo"]
         self.pluginTypeAlias = \
@@ -28,18 +36,30 @@ class Cfg(object):
 
     def disableDemo(self):
         self.cfg["Workflow"]["Demo"]["Enable"] = "False"
+        self.index()
 
     def enableDemo(self):
         self.cfg["Workflow"]["Demo"]["Enable"] = "True"
+        self.index()
+
+    @staticmethod
+    def freeze(value):
+        if isinstance(value, dict):
+            return types.MappingProxyType({name: Cfg.freeze(item) for name, item in value.items()})
+        if isinstance(value, list):
+            return tuple(Cfg.freeze(item) for item in value)
+        return value
 
     def getCfg(self):
-        return copy.deepcopy(self.cfg)
+        if self.cfgView is None:
+            self.cfgView = Cfg.freeze(self.cfg)
+        return self.cfgView
 
     def getPlugin(self, pluginType, pluginName):
-        for plugin in self.cfg["Plugin"]:
-            if plugin["Type"] == pluginType and plugin["Name"] == pluginName:
-                return plugin
-        Error.raiseException("Plugin {0}:{1} not found.".format(pluginType, pluginName))
+        plugin = self.plugins.get((pluginType, pluginName))
+        if plugin is None:
+            Error.raiseException("Plugin {0}:{1} not found.".format(pluginType, pluginName))
+        return plugin
 
     def getPlugins(self):
         if len(self.cfg["Plugin"]) < 1:
@@ -47,24 +67,20 @@ class Cfg(object):
         return {"Plugin": self.cfg["Plugin"]}
 
     def getPluginsByType(self, pluginType):
-        plugins = []
         if pluginType == "Input" or pluginType == "Output":
             pluginType = "IO"
-        for plugin in self.cfg["Plugin"]:
-            if plugin["Type"] == pluginType:
-                plugins.append(plugin)
+        plugins = self.pluginsByType.get(pluginType, [])
         if len(plugins) < 1:
             return {"Plugin:":[]}
         return {"Plugin": plugins}
 
     def getPluginMethod(self, pluginType, pluginName, pluginMethod):
-        methods = self.getPlugin(pluginType, pluginName)["Method"]
-        for method in methods:
-            if pluginMethod == method["Name"]:
-                return method
-        Error.raiseException(
-        "Can't find {0}::{1}::{2}()".format(
-            pluginType, pluginName, pluginMethod))
+        method = self.pluginMethods.get((pluginType, pluginName, pluginMethod))
+        if method is None:
+            Error.raiseException(
+            "Can't find {0}::{1}::{2}()".format(
+                pluginType, pluginName, pluginMethod))
+        return method
 
     def getPluginMethods(self, pluginType, pluginName):
         methods = self.getPlugin(pluginType, pluginName)["Method"]
@@ -109,16 +125,7 @@ class Cfg(object):
         return target
 
     def getWorkflowPlugin(self, pluginType):
-        plugin = self.cfg["Workflow"][pluginType]
-        plugin["Type"] = pluginType
-        plugin["Alias"] = pluginType
-        if pluginType == "Input" or pluginType == "Output":
-            plugin["Alias"] = "IO"
-        plugin["__workflowSourcePath__"] = self.getWorkflowSourcePath()
-        plugin["__workflowTargetPath__"] = self.getWorkflowTargetPath()
-        plugin["__projectID__"] = self.getProjectID()
-        plugin["__projectDescription__"] = self.getProjectDescription()
-        return plugin
+        return self.workflowPlugins[pluginType]
 
     def getWorkflowSourcePath(self):
         if Text.isNothing(self.cfg["Workflow"]["Input"]["Source"]):
@@ -130,6 +137,27 @@ class Cfg(object):
             return None
         return self.cfg["Workflow"]["Output"]["Target"]
 
+    def index(self):
+        self.cfgView = None
+        self.plugins = {}
+        self.pluginMethods = {}
+        self.pluginsByType = {}
+        for plugin in self.cfg["Plugin"]:
+            self.plugins.setdefault((plugin["Type"], plugin["Name"]), plugin)
+            self.pluginsByType.setdefault(plugin["Type"], []).append(plugin)
+            for method in plugin["Method"] or []:
+                self.pluginMethods.setdefault((plugin["Type"], plugin["Name"], method["Name"]), method)
+        self.workflowPlugins = {}
+        for pluginType, workflowPlugin in self.cfg["Workflow"].items():
+            plugin = dict(workflowPlugin)
+            plugin["Type"] = pluginType
+            plugin["Alias"] = self.pluginTypeAlias[pluginType]
+            plugin["__workflowSourcePath__"] = self.getWorkflowSourcePath()
+            plugin["__workflowTargetPath__"] = self.getWorkflowTargetPath()
+            plugin["__projectID__"] = self.getProjectID()
+            plugin["__projectDescription__"] = self.getProjectDescription()
+            self.workflowPlugins[pluginType] = types.MappingProxyType(plugin)
+
     def isWorkflowDemoEnabled(self):
         return Text.isTrue(self.cfg["Workflow"]["Demo"]["Enable"])
 
@@ -151,6 +179,7 @@ class Cfg(object):
             self.cfg = json.loads(fd.read())
             for name, value in self.cfg.items():
                 self.__dict__[name] = value
+        self.index()
         if verifyFlag:
             self.verify()
         self.cfgPath = __cfgPath
@@ -167,52 +196,38 @@ class Cfg(object):
         Msg.flush()
 
     def verify(self):
-        for name, value in self.cfg.items():
-            if name == "ProjectID":
-                if len(value) > 256 or Text.isNothing(value):
-                    Error.raiseException(
-                    "{0} can only be 256 characters or less: {1}".format(name, value))
-                if re.search(r'[^A-Za-z0-9_\-\\]', value):
-                    Error.raiseException(
-                    "{0} contains invalid characters: {1}".format(name, value))
-            if Text.isNothing(value):
-                Error.raiseException(
-                "Missing '{0}' value in {1}".format(name, self.cfgPath))
-        pluginLookupMap = []
+        CfgSchema.validate(self.cfg, self.cfgPath)
+        pluginIndex = Framework.getPluginIndex()
+        pluginLookupMap = set()
         for plugin in self.cfg["Plugin"]:
-            pluginMethods = self.getPluginMethods(plugin["Type"], plugin["Name"])
-            for pluginMethod in pluginMethods["Method"]:
-                if not Framework.hasPluginClassMethod(
-                    plugin["Type"], plugin["Name"], pluginMethod["Name"]):
-                        Error.raiseException(
-                        "Can't find {0}::{1}::{2}()".format(
-                            plugin["Type"], plugin["Name"], pluginMethod["Name"]))
-                pluginLookupMap.append(
-                    "{0}{1}{2}".format(plugin["Type"], plugin["Name"], pluginMethod["Name"]))
+            methods = pluginIndex.get((plugin["Type"], plugin["Name"]), ())
+            for pluginMethod in plugin["Method"]:
+                if pluginMethod["Name"] not in methods:
+                    Error.raiseException(
+                    "Can't find {0}::{1}::{2}()".format(
+                        plugin["Type"], plugin["Name"], pluginMethod["Name"]))
+                pluginLookupMap.add((plugin["Type"], plugin["Name"], pluginMethod["Name"]))
         if len(self.cfg["Workflow"]["Demo"]["Plugin"]) != len(self.cfg["Workflow"]["Demo"]["Method"]):
             Error.raiseException("Mismatched number of demo plugins and methods")
-        workflowPluginLookupMap = []
         for workflowPluginType, workflowPluginCfg in self.cfg["Workflow"].items():
             pluginType = self.pluginTypeAlias[workflowPluginType]
             if pluginType != "Demo":
-                workflowPluginLookupMap.append(
-                    "{0}{1}{2}".format(pluginType, workflowPluginCfg["Plugin"],
-                                       workflowPluginCfg["Method"]))
+                keys = [(pluginType, workflowPluginCfg["Plugin"], workflowPluginCfg["Method"])]
             else:
-                for i in range(0, len(workflowPluginCfg["Plugin"])):
-                    key = "{0}{1}{2}".format(pluginType, workflowPluginCfg["Plugin"][i],
-                                             workflowPluginCfg["Method"][i])
-                    if key not in pluginLookupMap:
-                        Error.raiseException(
-                        "Can't find workflow plugin {0}::{1}::{2}()".format(
-                            workflowPluginType, workflowPluginCfg["Plugin"][i],
-                            workflowPluginCfg["Method"][i]))
+                keys = [(pluginType, workflowPluginCfg["Plugin"][i], workflowPluginCfg["Method"][i])
+                        for i in range(0, len(workflowPluginCfg["Plugin"]))]
+            for key in keys:
+                if key not in pluginLookupMap:
+                    Error.raiseException(
+                    "Can't find workflow plugin {0}::{1}::{2}()".format(
+                        workflowPluginType, key[1], key[2]))
 
 class CfgEditor(object):
 
     def __init__(self):
         self.cfg = None
         self.cfgPath = None
+        self.cfgView = None
 
     def deleteCfg(self):
         if Text.isNone(self.cfgPath):
@@ -220,10 +235,13 @@ class CfgEditor(object):
         File.delete(self.cfgPath)
 
     def getCfg(self):
-        return copy.deepcopy(self.cfg)
+        if self.cfgView is None:
+            self.cfgView = Cfg.freeze(self.cfg)
+        return self.cfgView
 
     def loadCfg(self, cfgPath):
         self.cfgPath = cfgPath
+        self.cfgView = None
         with open(cfgPath) as fd:
             self.cfg = json.load(fd)
 
@@ -240,23 +258,68 @@ class CfgEditor(object):
     def setCfg(self, cfg):
         self.cfg = cfg
         self.cfgPath = None
+        self.cfgView = None
 
     def setDatabase(self, cfg):
         for name, value in cfg.items():
             self.cfg["Database"][name] = value
+        self.cfgView = None
 
     def setDatabaseName(self, name):
         self.cfg["Database"]["Name"] = name
+        self.cfgView = None
 
     def setProjectID(self, projectID):
         self.cfg["ProjectID"] = projectID
+        self.cfgView = None
 
     def setWorkflowInputSource(self, path):
         self.cfg["Workflow"]["Input"]["Source"] = path
+        self.cfgView = None
 
     def setWorkflowOutputTarget(self, path):
         self.cfg["Workflow"]["Output"]["Target"] = path
+        self.cfgView = None
 
     def setWorkflowPlugin(self, pluginType, cfg):
         for name, value in cfg.items():
             self.cfg["Workflow"][pluginType][name] = value
+        self.cfgView = None
+
+class CfgWatcher(object):
+
+    def __init__(self, cfgPath, callback, interval=2):
+        self.cfgPath = cfgPath
+        self.callback = callback
+        self.interval = interval
+        self.mtime = self.getMTime()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def check(self):
+        mtime = self.getMTime()
+        if mtime is None or mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        self.callback()
+        return True
+
+    def getMTime(self):
+        try:
+            return os.stat(self.cfgPath).st_mtime_ns
+        except OSError:
+            return None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.__watch, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def __watch(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                Msg.showWarning("Ignoring cfg change in {0}: {1}".format(self.cfgPath, str(e)))
@@ -0,0 +1,185 @@
+import re
+from Core.Error import Error
+
+class CfgSchema(object):
+
+    __flag = {"type": ["string", "boolean"]}
+    __name = {"type": "string", "pattern": r"\S"}
+    __path = {"type": ["string", "null"]}
+    __workflowPlugin = {
+        "type": "object",
+        "required": ["Plugin", "Method", "Edit", "Debug"],
+        "properties": {"Plugin": __name, "Method": __name, "Edit": __flag, "Debug": __flag}
+    }
+    schema = {
+        "type": "object",
+        "required": ["ProjectID", "Title", "Description", "Database", "Workflow", "Plugin"],
+        "properties": {
+            "ProjectID": {"type": "string", "maxLength": 256, "pattern": r"^[A-Za-z0-9_\-\\]+$"},
+            "Title": __name,
+            "Description": __name,
+            "Database": {
+                "type": "object",
+                "required": ["Name", "Enable", "Debug", "Rebuild"],
+                "properties": {"Name": __name, "Enable": __flag, "Debug": __flag, "Rebuild": __flag}
+            },
+            "Storage": {
+                "type": "object",
+                "properties": {
+                    "Durability": {"type": "string", "enum": ["None", "Flush", "Fsync"]}
+                }
+            },
+            "Web": {
+                "type": "object",
+                "required": ["Browser", "Debug", "Host", "Port", "RefreshCertificate",
+                             "RefreshPassword", "Reloader", "UseAuthentication", "UseHttps"],
+                "properties": {
+                    "Browser": {"type": "array", "minItems": 1, "items": {"type": "string"}},
+                    "CertificateKeyType": {"type": "string", "enum": ["RSA", "ECDSA"]},
+                    "Debug": __flag,
+                    "Host": __name,
+                    "PasswordRounds": {"type": ["string", "integer"], "pattern": r"^[0-9]+$"},
+                    "Port": {"type": ["string", "integer"], "pattern": r"^[0-9]+$"},
+                    "RefreshCertificate": __flag,
+                    "RefreshPassword": __flag,
+                    "ReloadCfg": __flag,
+                    "Reloader": __flag,
+                    "Session": {"type": "string", "enum": ["Cookie", "File", "Memory"]},
+                    "UseAuthentication": __flag,
+                    "UseHttps": __flag
+                }
+            },
+            "Workflow": {
+                "type": "object",
+                "required": ["Input", "Analyzer", "Translator", "Output", "Demo"],
+                "properties": {
+                    "Input": dict(__workflowPlugin,
+                                  required=__workflowPlugin["required"] + ["Source"],
+                                  properties=dict(__workflowPlugin["properties"], Source=__path)),
+                    "Analyzer": __workflowPlugin,
+                    "Translator": __workflowPlugin,
+                    "Output": dict(__workflowPlugin,
+                                   required=__workflowPlugin["required"] + ["Target"],
+                                   properties=dict(__workflowPlugin["properties"], Target=__path)),
+                    "Demo": {
+                        "type": "object",
+                        "required": ["Plugin", "Method", "Enable"],
+                        "properties": {
+                            "Plugin": {"type": "array", "items": __name},
+                            "Method": {"type": "array", "items": __name},
+                            "Enable": __flag
+                        }
+                    }
+                }
+            },
+            "Plugin": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["Name", "Type", "Method"],
+                    "properties": {
+                        "Name": {"type": "string", "pattern": r"^[A-Za-z_][A-Za-z0-9_]*$"},
+                        "Type": {"type": "string", "enum": ["IO", "Analyzer", "Translator", "Demo"]},
+                        "Method": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "required": ["Name"],
+                                "properties": {
+                                    "Name": {"type": "string", "pattern": r"^[A-Za-z_][A-Za-z0-9_]*$"},
+                                    "Params": {"type": "object"}
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    types = {
+        "array": (list,),
+        "boolean": (bool,),
+        "integer": (int,),
+        "null": (type(None),),
+        "object": (dict,),
+        "string": (str,)
+    }
+    validator = None
+
+    @staticmethod
+    def compile(schema):
+        checks = []
+        if "type" in schema:
+            typeNames = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+            pythonTypes = tuple(t for typeName in typeNames for t in CfgSchema.types[typeName])
+            isBooleanAllowed = "boolean" in typeNames
+            def checkType(value, path):
+                if not isinstance(value, pythonTypes) or \
+                   (isinstance(value, bool) and not isBooleanAllowed):
+                    return "'{0}' must be {1}".format(path, " or ".join(typeNames))
+            checks.append(checkType)
+        if "enum" in schema:
+            choices = frozenset(schema["enum"])
+            def checkEnum(value, path):
+                if value not in choices:
+                    return "'{0}' must be one of {1}: {2}".format(path, ", ".join(sorted(choices)), value)
+            checks.append(checkEnum)
+        if "pattern" in schema:
+            pattern = re.compile(schema["pattern"])
+            def checkPattern(value, path):
+                if isinstance(value, (str, int)) and not pattern.search(str(value)):
+                    return "'{0}' contains invalid characters: {1}".format(path, value)
+            checks.append(checkPattern)
+        if "maxLength" in schema:
+            maxLength = schema["maxLength"]
+            def checkMaxLength(value, path):
+                if isinstance(value, str) and len(value) > maxLength:
+                    return "'{0}' can only be {1} characters or less: {2}".format(path, maxLength, value)
+            checks.append(checkMaxLength)
+        if "minItems" in schema:
+            minItems = schema["minItems"]
+            def checkMinItems(value, path):
+                if isinstance(value, list) and len(value) < minItems:
+                    return "'{0}' needs at least {1} item(s)".format(path, minItems)
+            checks.append(checkMinItems)
+        if "required" in schema:
+            required = tuple(schema["required"])
+            def checkRequired(value, path):
+                if isinstance(value, dict):
+                    for name in required:
+                        if name not in value:
+                            return "Missing '{0}/{1}' value".format(path, name)
+            checks.append(checkRequired)
+        if "properties" in schema:
+            properties = {name: CfgSchema.compile(item) for name, item in schema["properties"].items()}
+            def checkProperties(value, path):
+                if isinstance(value, dict):
+                    for name, validate in properties.items():
+                        if name in value:
+                            error = validate(value[name], "{0}/{1}".format(path, name))
+                            if error is not None:
+                                return error
+            checks.append(checkProperties)
+        if "items" in schema:
+            validateItem = CfgSchema.compile(schema["items"])
+            def checkItems(value, path):
+                if isinstance(value, list):
+                    for i, item in enumerate(value):
+                        error = validateItem(item, "{0}[{1}]".format(path, i))
+                        if error is not None:
+                            return error
+            checks.append(checkItems)
+        def validate(value, path):
+            for check in checks:
+                error = check(value, path)
+                if error is not None:
+                    return error
+        return validate
+
+    @staticmethod
+    def validate(cfg, cfgPath=None):
+        if CfgSchema.validator is None:
+            CfgSchema.validator = CfgSchema.compile(CfgSchema.schema)
+        error = CfgSchema.validator(cfg, "")
+        if error is not None:
+            Error.raiseException("{0} in {1}".format(error, cfgPath))
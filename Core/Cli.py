@@ -1,4 +1,6 @@
+import sys
 from Core.Editor import Editor
+from Core.File import File
 from Core.Msg import Msg
 from Core.Text import Text
 
@@ -23,7 +25,7 @@ class Cli():
             Cli.__runEditor(Cli.cocoscats.frameworkParams["analyzerPath"],
                             Cli.cocoscats.frameworkParams["analyzerPath"])
         if Cli.cocoscats.isWorkflowDebugTrue("Analyzer"):
-            Msg.showRaw(content)
+            Cli.__showContent(content, Cli.cocoscats.frameworkParams["analyzerPath"])
 
     def __runDemo():
         if not Cli.cocoscats.isWorkflowDemoEnabled() or \
@@ -71,7 +73,7 @@ Please make a selection to run demo or 'x' to exit.\n"""
             Cli.__runEditor(Cli.cocoscats.frameworkParams["inputPath"],
                             Cli.cocoscats.frameworkParams["inputPath"])
         if Cli.cocoscats.isWorkflowDebugTrue("Input"):
-            Msg.showRaw(content)
+            Cli.__showContent(content, Cli.cocoscats.frameworkParams["inputPath"])
 
     def __runOutput():
         Msg.show("Execute: Output Stage")
@@ -80,7 +82,7 @@ Please make a selection to run demo or 'x' to exit.\n"""
             Cli.__runEditor(Cli.cocoscats.frameworkParams["outputPath"],
                             Cli.cocoscats.frameworkParams["outputPath"])
         if Cli.cocoscats.isWorkflowDebugTrue("Output"):
-            Msg.showRaw(content)
+            Cli.__showContent(content, Cli.cocoscats.frameworkParams["outputPath"])
 
     def __runTranslator():
         Msg.show("Execute: Translation Stage")
@@ -89,4 +91,16 @@ Please make a selection to run demo or 'x' to exit.\n"""
             Cli.__runEditor(Cli.cocoscats.frameworkParams["translatorPath"],
                             Cli.cocoscats.frameworkParams["translatorPath"])
         if Cli.cocoscats.isWorkflowDebugTrue("Translator"):
-            Msg.showRaw(content)
+            Cli.__showContent(content, Cli.cocoscats.frameworkParams["translatorPath"])
+
+    def __showContent(content, path):
+        if content is None and File.isBinary(path):
+            Msg.show("Binary content saved to: {0}".format(path))
+            return
+        if content is None:
+            sys.stdout.write("\n")
+            for chunk in File.iterChunks(path):
+                sys.stdout.write(chunk)
+            sys.stdout.write("\n")
+            return
+        Msg.showRaw(content)
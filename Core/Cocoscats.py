@@ -2,6 +2,7 @@ import datetime
 import importlib
 import os
 import sys
+from Core.Blob import Blob
 from Core.Cfg import Cfg
 from Core.Database import Database
 from Core.Directory import Directory
@@ -64,6 +65,7 @@ class Cocoscats(Cfg):
             Database.create(True)
 
     def __initializeFramework(self):
+        File.durability = self.cfg.get("Storage", {}).get("Durability", File.durability)
         self.frameworkParams["projectID"] = self.getProjectID()
         self.frameworkParams["dataDir"] = "{0}/Data/{1}".format(self.installDir, self.getProjectID())
         Directory.make(self.frameworkParams["dataDir"])
@@ -76,11 +78,18 @@ class Cocoscats(Cfg):
 
     def purgeContent(self):
         self.purgeContentByTypes(["originalPath", "inputPath", "analyzerPath", "translatorPath", "outputPath"])
+        File.delete(Result.getTranslatorResultPath(self.frameworkParams["translatorPath"]))
 
     def purgeContentByTypes(self, contentTypes):
         for contentType in contentTypes:
             File.delete(self.frameworkParams[contentType])
 
+    def reload(self):
+        cocoscats = Cocoscats(self.cfgPath)
+        super(Cocoscats, cocoscats).load(True)
+        cocoscats.__initializeFramework()
+        return cocoscats
+
     def runAnalyzer(self):
         content = self.__callPluginMethod("Analyzer", self.getWorkflowPlugin("Analyzer"), self.frameworkParams)
         return File.getContent(self.frameworkParams["analyzerPath"])
@@ -90,8 +99,14 @@ class Cocoscats(Cfg):
         return 1
 
     def runInput(self):
+        File.delete(self.frameworkParams["inputPath"])
         content = self.__callPluginMethod("IO", self.getWorkflowPlugin("Input"), self.frameworkParams)
-        File.setContent(self.frameworkParams["originalPath"], content)
+        if not File.exists(self.frameworkParams["inputPath"]):
+            if content is None:
+                Error.raiseException("Input plugin returned no content and wrote no input file")
+            Blob.setContent(self.frameworkParams["originalPath"], content)
+        elif not Blob.link(self.frameworkParams["inputPath"], self.frameworkParams["originalPath"]):
+            File.copy(self.frameworkParams["inputPath"], self.frameworkParams["originalPath"])
         return content
 
     def runOutput(self):
@@ -141,18 +156,18 @@ class Cocoscats(Cfg):
                 PluginMethod=Database.sanitize(self.cfg["Workflow"]["Analyzer"]["Method"]),
                 Plugin=self.cfg["Workflow"]["Analyzer"])
 
-            content = Database.sanitize(File.getContent(self.frameworkParams["translatorPath"]))
             translatorTable = Database.Table.Translator(
                 ProjectID=projectTable,
-                Content=content,
-                ContentParsed=Result.parseTranslatorContent(content),
+                Content=Database.sanitize(File.getContent(self.frameworkParams["translatorPath"])),
+                ContentParsed=Database.sanitizeAll(
+                    Result.getTranslatorContentParsed(self.frameworkParams["translatorPath"])),
                 PluginName=Database.sanitize(self.cfg["Workflow"]["Translator"]["Plugin"]),
                 PluginMethod=Database.sanitize(self.cfg["Workflow"]["Translator"]["Method"]),
                 Plugin=self.cfg["Workflow"]["Translator"])
 
             outputTable = Database.Table.Output(
                 ProjectID=projectTable,
-                Content=Database.sanitize(File.getContent(self.frameworkParams["outputPath"])),
+                Content=Database.sanitize(File.getContentAsText(self.frameworkParams["outputPath"])),
                 Target=Database.sanitize(self.cfg["Workflow"]["Output"]["Target"]),
                 PluginName=Database.sanitize(self.cfg["Workflow"]["Output"]["Plugin"]),
                 PluginMethod=Database.sanitize(self.cfg["Workflow"]["Output"]["Method"]),
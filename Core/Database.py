@@ -29,7 +29,7 @@ class Database():
 
     @staticmethod
     def checkProjectExists(projectID):
-        return Database.getProject(projectID) is not None
+        return Database.getProjectDetails(projectID) is not None
 
     @staticmethod
     def commit():
@@ -39,7 +39,7 @@ class Database():
     def connect():
         try:
             Database.ODB.bind("sqlite", Database.path, create_db=True)
-        except TypeError:
+        except (TypeError, orm.BindingError):
             pass
         else:
             Database.ODB.generate_mapping(create_tables=True)
@@ -54,7 +54,7 @@ class Database():
         Directory.make(Database.directory)
         try:
             Database.ODB.bind("sqlite", Database.path, create_db=True)
-        except TypeError:
+        except (TypeError, orm.BindingError):
             pass
         else:
             Database.ODB.generate_mapping(create_tables=True)
@@ -135,7 +135,7 @@ class Database():
             }
 
     @staticmethod
-    def getProject(projectID):
+    def getProject(projectID, includeVocabulary=True):
         result = {
             "ProjectID": projectID,
             "Message": "",
@@ -171,6 +171,10 @@ class Database():
             result["L1"] = translatorContent["ContentParsed"]["L1"]
             result["L2"] = translatorContent["ContentParsed"]["L2"]
             result["L1L2"] = translatorContent["ContentParsed"]["L1L2"]
+            if not includeVocabulary:
+                result["Vocabulary"] = []
+                result["VocabularyParsed"] = []
+                result["Rejected"] = []
         else:
             result["Error"] = True
             result["Message"] = "No content found for project ID: {0}".format(projectID)
@@ -214,6 +218,13 @@ class Database():
                 projects.append(Database.getProjectDetails(r.ID))
             return projects
 
+    @staticmethod
+    def getVocabulary(projectID):
+        translatorContent = Database.getTranslatorContent(projectID)
+        if translatorContent is None or "ContentParsed" not in translatorContent:
+            return None
+        return translatorContent["ContentParsed"]["VocabularyParsed"]
+
     @staticmethod
     def getTranslatorContent(projectID):
         with Database.ORM.db_session:
@@ -236,6 +247,16 @@ class Database():
             something = something.replace("'", "\\'")
         return bleach.clean(something)
 
+    @staticmethod
+    def sanitizeAll(something):
+        if isinstance(something, dict):
+            return {name: Database.sanitizeAll(value) for name, value in something.items()}
+        if isinstance(something, list):
+            return [Database.sanitizeAll(value) for value in something]
+        if isinstance(something, str):
+            return Database.sanitize(something)
+        return something
+
     @staticmethod
     def setDebug(debugFlag):
         orm.sql_debug(debugFlag)
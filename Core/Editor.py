@@ -1,6 +1,7 @@
 import sys
 from tkinter import END, messagebox, Menu, Text, Tk, WORD, Y
 import traceback
+from Core.File import File
 from Core.Msg import Msg
 
 class Editor(object):
@@ -65,9 +66,8 @@ class Editor(object):
 
     def __save(self, event=None):
         try:
-            with open(self.__outputPath, "w", encoding="utf8") as fd:
-                fd.write(self.__text.get(0.0, END+'-1c'))
-                self.__text.edit_modified(False)
+            File.setContent(self.__outputPath, self.__text.get(0.0, END+'-1c'))
+            self.__text.edit_modified(False)
         except IOError as e:
             self.__handleException(e, True)
 
@@ -1,20 +1,61 @@
+import base64
+import codecs
+import contextlib
 import json
+import mmap
 import os
 from shutil import copyfile
 import tempfile
+import threading
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 from Core.Directory import Directory
 from Core.Error import Error
 
 class File():
+    __findCache = {}
+    bufferSize = 1024 * 1024
+    durability = "Flush"
+    durabilities = ["none", "flush", "fsync"]
+    FICLONE = 0x40049409
 
     @staticmethod
-    def copy(src, tgt, mkdirs=False):
+    def copy(src, tgt, mkdirs=False, durability=None):
+        durability = File.getDurability(durability)
+        tmpPath = None
         try:
             if mkdirs:
                 Directory.make(File.getDirectory(tgt))
-            copyfile(src, tgt)
+            File.unlinkShared(tgt)
+            if durability == "none":
+                File.__copyData(src, tgt)
+                return
+            tmpPath = File.getTempPath(tgt)
+            File.__copyData(src, tmpPath)
+            if durability == "fsync":
+                File.syncFile(tmpPath)
+            os.replace(tmpPath, tgt)
+            tmpPath = None
+            if durability == "fsync":
+                File.syncDirectory(File.getDirectory(tgt))
         except IOError as e:
             Error.handleException(e, True, True)
+        finally:
+            if tmpPath is not None:
+                File.delete(tmpPath)
+
+    @staticmethod
+    def __copyData(src, tgt):
+        if fcntl is not None:
+            try:
+                with open(src, "rb") as fdSrc, open(tgt, "wb") as fdTgt:
+                    fcntl.ioctl(fdTgt.fileno(), File.FICLONE, fdSrc.fileno())
+                return
+            except OSError:
+                pass
+        copyfile(src, tgt)
 
     @staticmethod
     def delete(path):
@@ -40,16 +81,20 @@ class File():
 
     @staticmethod
     def find(name):
+        key = (name, os.getcwd(), os.environ.get("PATH", ""))
+        if key in File.__findCache:
+            paths = File.__findCache[key]
+            return None if paths is None else list(paths)
         paths = []
-        if File.exist(name):
+        if File.exists(name):
             paths.append("{0}/{1}".format(File.getCanonicalPath(os.getcwd()), name))
-        for directory in os.environ["PATH"].split(os.pathsep):
+        for directory in key[2].split(os.pathsep):
             path = "{0}/{1}".format(File.getCanonicalPath(directory), name)
             if File.exists(path):
                 paths.append(path)
-        if len(paths) < 1:
-            return None
-        return list(set(paths))
+        paths = list(set(paths)) if len(paths) > 0 else None
+        File.__findCache[key] = paths
+        return None if paths is None else list(paths)
 
     @staticmethod
     def finds(names):
@@ -75,12 +120,15 @@ class File():
         return path.replace('\\', '/')
 
     @staticmethod
-    def getContent(path, asJson=False):
+    def getContent(path, asJson=False, asBytes=False):
         content = None
         try:
             if asJson:
                 with open(path, "r",  encoding="utf-8") as fd:
                     content = json.load(fd)
+            elif asBytes:
+                with open(path, "rb") as fd:
+                    content = fd.read()
             else:
                 with open(path, "r",  encoding="utf-8") as fd:
                     content = fd.read()
@@ -88,6 +136,31 @@ class File():
             Error.handleException(e, True, True)
         return content
 
+    @staticmethod
+    def getContentAsText(path):
+        if File.isBinary(path):
+            return base64.b64encode(File.getContent(path, asBytes=True)).decode("ascii")
+        return File.getContent(path)
+
+    @staticmethod
+    def getDurability(durability=None):
+        if durability is None:
+            durability = File.durability
+        durability = str(durability).lower()
+        if durability not in File.durabilities:
+            Error.raiseException("Unknown durability '{0}'. Use None, Flush or Fsync".format(durability))
+        return durability
+
+    @staticmethod
+    @contextlib.contextmanager
+    def getMap(path):
+        with open(path, "rb") as fd:
+            if os.fstat(fd.fileno()).st_size < 1:
+                yield b""
+                return
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content
+
     @staticmethod
     def getName(path):
         return File.getCanonicalPath(os.path.basename(os.path.splitext(path)[0]))
@@ -97,25 +170,126 @@ class File():
         return File.getCanonicalPath(os.path.abspath(os.path.join(path, os.pardir)))
 
     @staticmethod
-    def setContent(path, content, asJson=False, asBytes=False, mkdirs=False):
+    def getTempPath(path):
+        return "{0}.{1}.{2}.tmp".format(path, os.getpid(), threading.get_ident())
+
+    @staticmethod
+    def isBinary(path, size=8192):
+        with open(path, "rb") as fd:
+            sample = fd.read(size)
+        if b"\0" in sample:
+            return True
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        except UnicodeDecodeError:
+            return True
+        return False
+
+    @staticmethod
+    def iterChunks(path, size=None, asBytes=False):
+        if asBytes:
+            fd = open(path, "rb")
+        else:
+            fd = open(path, "r", encoding="utf-8")
+        with fd:
+            while True:
+                chunk = fd.read(size or File.bufferSize)
+                if not chunk:
+                    return
+                yield chunk
+
+    @staticmethod
+    def iterLines(path):
+        with open(path, "r", encoding="utf-8", buffering=File.bufferSize) as fd:
+            for line in fd:
+                yield line.rstrip("\r\n")
+
+    @staticmethod
+    def iterParagraphs(path):
+        paragraph = []
+        for line in File.iterLines(path):
+            if line.strip() == "":
+                if len(paragraph) > 0:
+                    yield "\n".join(paragraph)
+                    paragraph = []
+            else:
+                paragraph.append(line)
+        if len(paragraph) > 0:
+            yield "\n".join(paragraph)
+
+    @staticmethod
+    def setContent(path, content, asJson=False, asBytes=False, mkdirs=False, durability=None):
+        if asJson:
+            File.setContentFromChunks(path, json.JSONEncoder().iterencode(content),
+                                      mkdirs=mkdirs, durability=durability)
+        else:
+            File.setContentFromChunks(path, [content], asBytes, mkdirs, durability)
+
+    @staticmethod
+    def setContentFromChunks(path, chunks, asBytes=False, mkdirs=False, durability=None):
+        durability = File.getDurability(durability)
+        tmpPath = None
         try:
             if mkdirs:
                 Directory.make(File.getDirectory(path))
-            if asJson:
-                with open(path, "w", encoding="utf-8") as fd:
-                    json.dump(content, fd)
-            elif asBytes:
-                with open(path, "wb") as fd:
-                    fd.write(content)
+            File.unlinkShared(path)
+            writePath = path
+            if durability != "none":
+                tmpPath = writePath = File.getTempPath(path)
+            if asBytes:
+                fd = open(writePath, "wb", buffering=File.bufferSize)
             else:
-                with open(path, "w", encoding="utf-8") as fd:
-                    fd.write(content)
+                fd = open(writePath, "w", encoding="utf-8", buffering=File.bufferSize)
+            with fd:
+                for chunk in chunks:
+                    fd.write(chunk)
+                File.__sync(fd, durability)
+            if tmpPath is not None:
+                os.replace(tmpPath, path)
+                tmpPath = None
+                if durability == "fsync":
+                    File.syncDirectory(File.getDirectory(path))
         except IOError as e:
             Error.handleException(e, True, True)
+        finally:
+            if tmpPath is not None:
+                File.delete(tmpPath)
 
     @staticmethod
     def setContentToTempFile(content, suffix=""):
         fd = tempfile.NamedTemporaryFile(mode="w", suffix=suffix, delete=False)
         fd.write(content)
         fd.close()
-        return File.getCanonicalPath(fd.name)
\ No newline at end of file
+        return File.getCanonicalPath(fd.name)
+
+    @staticmethod
+    def __sync(fd, durability):
+        if durability == "fsync":
+            fd.flush()
+            os.fsync(fd.fileno())
+
+    @staticmethod
+    def syncDirectory(path):
+        if os.name == "nt":
+            return
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def syncFile(path):
+        fd = os.open(path, os.O_RDWR)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def unlinkShared(path):
+        try:
+            if os.stat(path).st_nlink > 1:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -1,11 +1,15 @@
+import ast
 import glob
 import importlib
 import json
 import os
 from Core.Directory import Directory
+from Core.Error import Error
 from Core.Msg import Msg
 
 class Framework():
+    __pluginIndex = None
+    __pluginManifest = None
 
     @staticmethod
     def getDataDir():
@@ -27,6 +31,68 @@ class Framework():
                     methodName), True, True)
         return method
 
+    @staticmethod
+    def getPluginManifest():
+        pluginsDir = Framework.getPluginsDir()
+        manifestPath = "{0}/PluginManifest.json".format(Framework.getDataDir())
+        if Framework.__pluginManifest is None:
+            Framework.__pluginManifest = {}
+            if os.path.isfile(manifestPath):
+                try:
+                    with open(manifestPath) as fd:
+                        Framework.__pluginManifest = json.load(fd)
+                except ValueError:
+                    pass
+        manifest = {}
+        changed = False
+        for path in glob.glob("{0}/*.py".format(pluginsDir)) + glob.glob("{0}/*/*.py".format(pluginsDir)):
+            name = Directory.getCanonicalPath(os.path.relpath(path, pluginsDir))
+            stat = os.stat(path)
+            record = Framework.__pluginManifest.get(name)
+            if record is None or record["MTime"] != stat.st_mtime_ns or record["Size"] != stat.st_size:
+                record = {"MTime": stat.st_mtime_ns,
+                          "Size": stat.st_size,
+                          "Classes": Framework.__parsePluginClasses(path)}
+                changed = True
+            manifest[name] = record
+        if changed or len(manifest) != len(Framework.__pluginManifest):
+            Framework.__pluginManifest = manifest
+            Framework.__pluginIndex = None
+            try:
+                Directory.make(Framework.getDataDir())
+                with open(manifestPath, "w") as fd:
+                    json.dump(manifest, fd, sort_keys=True, indent=1)
+            except OSError:
+                pass
+        return Framework.__pluginManifest
+
+    @staticmethod
+    def getPluginIndex():
+        manifest = Framework.getPluginManifest()
+        if Framework.__pluginIndex is not None:
+            return Framework.__pluginIndex
+        classes = {}
+        for record in manifest.values():
+            classes.update(record["Classes"])
+        index = {}
+        for name, record in manifest.items():
+            pluginType, pluginName = os.path.split(os.path.splitext(name)[0])
+            if pluginName not in record["Classes"]:
+                continue
+            methods = set()
+            pending = [pluginName]
+            seen = set()
+            while pending:
+                className = pending.pop()
+                if className in seen or className not in classes:
+                    continue
+                seen.add(className)
+                methods.update(classes[className]["Methods"])
+                pending.extend(classes[className]["Bases"])
+            index[(pluginType, pluginName)] = frozenset(methods)
+        Framework.__pluginIndex = index
+        return index
+
     @staticmethod
     def getPluginsDir():
         return "{0}/Plugin".format(Framework.getInstallDir())
@@ -74,14 +140,30 @@ class Framework():
 
     @staticmethod
     def hasPluginClassMethod(pluginType, pluginName, pluginMethod):
-        plugin = None
-        try:
-            plugin = getattr(importlib.import_module(
-                "Plugin.{0}.{1}".format(pluginType, pluginName)), pluginName)
-        except Exception as e:
-            print(e)
-            return False
-        return pluginMethod in dir(plugin)
+        return pluginMethod in Framework.getPluginIndex().get((pluginType, pluginName), ())
+
+    @staticmethod
+    def __parsePluginClasses(path):
+        with open(path, "rb") as fd:
+            tree = ast.parse(fd.read(), path)
+        classes = {}
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            methods = []
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    methods.append(item.name)
+                elif isinstance(item, ast.Assign):
+                    methods.extend(target.id for target in item.targets if isinstance(target, ast.Name))
+            bases = []
+            for base in node.bases:
+                if isinstance(base, ast.Name):
+                    bases.append(base.id)
+                elif isinstance(base, ast.Attribute):
+                    bases.append(base.attr)
+            classes[node.name] = {"Bases": bases, "Methods": sorted(methods)}
+        return classes
 
     @staticmethod
     def showAllPluginFiles():
@@ -0,0 +1,73 @@
+import os
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+from Core.Error import Error
+from Core.File import File
+
+class Parquet(object):
+    columns = ["Project", "L1", "L2", "Pos", "Cnt"]
+    compressions = ["brotli", "gzip", "lz4", "none", "snappy", "zstd"]
+    rowGroupSize = 64 * 1024
+
+    @staticmethod
+    def getSchema():
+        return pyarrow.schema([
+            ("Project", pyarrow.string()),
+            ("L1", pyarrow.string()),
+            ("L2", pyarrow.string()),
+            ("Pos", pyarrow.string()),
+            ("Cnt", pyarrow.int32())
+        ])
+
+    @staticmethod
+    def isAvailable():
+        return pyarrow is not None
+
+    @staticmethod
+    def __iterBatches(rows, rowGroupSize):
+        batch = {name: [] for name in Parquet.columns}
+        size = 0
+        for row in rows:
+            for name, value in zip(Parquet.columns, row):
+                batch[name].append(value)
+            size += 1
+            if size >= rowGroupSize:
+                yield batch
+                batch = {name: [] for name in Parquet.columns}
+                size = 0
+        if size > 0:
+            yield batch
+
+    @staticmethod
+    def iterVocabularyRows(projectID, vocabulary):
+        for l1, l2, pos, cnt in sorted(vocabulary.toRows(), key=lambda row: (row[0], row[2])):
+            yield (projectID, l1, l2, pos, cnt)
+
+    @staticmethod
+    def write(path, rows, compression="Zstd", rowGroupSize=None):
+        if pyarrow is None:
+            Error.raiseException("Parquet output requires the pyarrow package")
+        compression = str(compression).lower()
+        if compression not in Parquet.compressions:
+            Error.raiseException("Unknown Parquet compression '{0}'. Use {1}".format(
+                compression, ", ".join(Parquet.compressions)))
+        if rowGroupSize is None or rowGroupSize < 1:
+            rowGroupSize = Parquet.rowGroupSize
+        schema = Parquet.getSchema()
+        tmpPath = File.getTempPath(path)
+        count = 0
+        try:
+            with pyarrow.parquet.ParquetWriter(tmpPath, schema, compression=compression,
+                                               use_dictionary=["Project", "Pos"],
+                                               write_statistics=True) as writer:
+                for batch in Parquet.__iterBatches(rows, rowGroupSize):
+                    writer.write_table(pyarrow.Table.from_pydict(batch, schema=schema),
+                                       row_group_size=rowGroupSize)
+                    count += len(batch["Project"])
+            os.replace(tmpPath, path)
+        finally:
+            File.delete(tmpPath)
+        return count
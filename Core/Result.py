@@ -1,7 +1,17 @@
+import base64
+import csv
+import io
+import os
 import re
+from Core.File import File
+from Core.Vocabulary import Vocabulary
 
 class Result():
 
+    base64ChunkSize = 3 * 64 * 1024
+    sections = ["[VOCABULARY]", "[REJECTED]", "[L1]", "[L2]"]
+    version = 4
+
     def parseTranslatorContent(content):
         tokens = content.split("\n")
         idx = []
@@ -9,13 +19,15 @@ class Result():
             idx.append(tokens.index(section))
         L1 = "\n".join(tokens[idx[2]+1:idx[3]]).strip()
         L2 = "\n".join(tokens[idx[3]+1:]).strip()
-        L1L2 = L1
+        replacements = {}
         vocabularyParsed = []
         vocabulary = list(filter(None, tokens[idx[0]+1:idx[1]]))
         for token in vocabulary:
-            l1, l2, pos, cnt = token.split(",")
-            L1L2 = re.sub(r"\b{0}\b".format(l1), "{{{0}}}".format(l2), L1L2, re.IGNORECASE)
+            l1, l2, pos, cnt = Result.parseVocabularyToken(token)
+            if l1 != "":
+                replacements.setdefault(l1.lower(), "{{{0}}}".format(l2))
             vocabularyParsed.append({"L1": l1, "L2": l2, "Pos": pos, "Cnt": cnt})
+        L1L2 = Result.replaceVocabulary(L1, replacements)
         rejected = list(filter(None, tokens[idx[1]+1:idx[2]]))
         return {
             "Vocabulary": vocabulary,
@@ -26,4 +38,157 @@ class Result():
             "L1": L1,
             "L2": L2,
             "L1L2": L1L2
-        }
\ No newline at end of file
+        }
+
+    def parseVocabularyToken(token):
+        if "\"" not in token:
+            return token.split(",")
+        return next(csv.reader([token]))
+
+    def formatVocabularyToken(l1, l2, pos, cnt):
+        if not any("," in str(value) or "\"" in str(value) for value in (l1, l2, pos, cnt)):
+            return "{0},{1},{2},{3}".format(l1, l2, pos, cnt)
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="").writerow([l1, l2, pos, cnt])
+        return buffer.getvalue()
+
+    def encodeBase64(value):
+        return "".join(Result.iterBase64([value]))
+
+    def iterBase64(chunks):
+        data = bytearray()
+        for chunk in chunks:
+            data += chunk.encode("utf-8")
+            if len(data) >= Result.base64ChunkSize:
+                size = len(data) - len(data) % 3
+                yield base64.b64encode(data[:size]).decode("ascii")
+                del data[:size]
+        if len(data) > 0:
+            yield base64.b64encode(data).decode("ascii")
+
+    def iterLinesStripped(lines):
+        blanks = []
+        previous = None
+        for line in lines:
+            if previous is None:
+                line = line.lstrip()
+                if line == "":
+                    continue
+            elif line.strip() == "":
+                blanks.append(line)
+                continue
+            if previous is not None:
+                yield previous
+            for blank in blanks:
+                yield blank
+            blanks = []
+            previous = line
+        if previous is not None:
+            yield previous.rstrip()
+
+    def iterTranslatorL1L2(path):
+        L1L2 = Result.getTranslatorResult(path)["L1L2"]
+        if L1L2 != "":
+            yield from L1L2.split("\n")
+
+    def iterTranslatorSection(path, section):
+        current = None
+        for line in File.iterLines(path):
+            if line in Result.sections:
+                if current == section:
+                    return
+                current = line
+            elif current == section:
+                yield line
+
+    def iterTranslatorSections(path):
+        current = None
+        for line in File.iterLines(path):
+            if line in Result.sections:
+                current = line
+            elif current is not None:
+                yield current, line
+
+    def iterTranslatorValue(path, name, encodeWithBase64=False):
+        if encodeWithBase64:
+            return Result.iterBase64(Result.iterTranslatorValue(path, name))
+        if name == "L1L2":
+            lines = Result.iterTranslatorL1L2(path)
+        else:
+            lines = Result.iterLinesStripped(Result.iterTranslatorSection(path, "[{0}]".format(name)))
+        return Result.__iterJoined(lines)
+
+    def __iterJoined(lines):
+        separator = ""
+        for line in lines:
+            yield separator
+            yield line
+            separator = "\n"
+
+    def replaceVocabulary(content, replacements):
+        if len(replacements) < 1:
+            return content
+        trie = {}
+        for word in replacements:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = None
+        pattern = re.compile(r"\b(?:{0})\b".format(Result.__getTriePattern(trie)), flags=re.IGNORECASE)
+        return pattern.sub(lambda match: replacements.get(match.group(0).lower(), match.group(0)), content)
+
+    def __getTriePattern(trie):
+        alternatives = [re.escape(char) + Result.__getTriePattern(trie[char]) for char in sorted(trie) if char != ""]
+        if len(alternatives) < 1:
+            return ""
+        if len(alternatives) == 1 and "" not in trie:
+            return alternatives[0]
+        pattern = "(?:{0})".format("|".join(alternatives))
+        return "{0}?".format(pattern) if "" in trie else pattern
+
+    def getTranslatorVocabulary(path):
+        return list(filter(None, Result.iterTranslatorSection(path, "[VOCABULARY]")))
+
+    def getTranslatorContentParsed(path):
+        result = Result.getTranslatorResult(path)
+        vocabulary = Vocabulary.fromColumns(result["Vocabulary"])
+        return {
+            "Vocabulary": [Result.formatVocabularyToken(*row) for row in vocabulary.toRows()],
+            "VocabularyParsed": vocabulary.toDicts(),
+            "VocabularyCnt": len(vocabulary),
+            "Rejected": result["Rejected"],
+            "RejectedCnt": len(result["Rejected"]),
+            "L1": result["L1"],
+            "L2": result["L2"],
+            "L1L2": result["L1L2"]
+        }
+
+    def getTranslatorResult(path):
+        resultPath = Result.getTranslatorResultPath(path)
+        source = Result.__getTranslatorSource(path)
+        if File.exists(resultPath):
+            result = File.getContent(resultPath, asJson=True)
+            if result.get("Version") == Result.version and result.get("Source") == source:
+                return result
+        parsed = Result.parseTranslatorContent(File.getContent(path))
+        result = {
+            "Version": Result.version,
+            "Source": source,
+            "Vocabulary": Vocabulary.fromDicts(parsed["VocabularyParsed"]).getColumns(),
+            "Rejected": parsed["Rejected"],
+            "L1": parsed["L1"],
+            "L2": parsed["L2"],
+            "L1L2": parsed["L1L2"]
+        }
+        File.setContent(resultPath, result, asJson=True)
+        return result
+
+    def getTranslatorVocabularyEntries(path):
+        return Vocabulary.fromColumns(Result.getTranslatorResult(path)["Vocabulary"])
+
+    def getTranslatorResultPath(path):
+        return "{0}.json".format(os.path.splitext(path)[0])
+
+    def __getTranslatorSource(path):
+        stat = os.stat(path)
+        return {"Ino": stat.st_ino, "MTime": stat.st_mtime_ns, "Size": stat.st_size}
@@ -1,4 +1,5 @@
 import base64
+from cryptography.hazmat.primitives.asymmetric import ec
 import datetime
 import getpass
 import hashlib
@@ -6,6 +7,7 @@ import OpenSSL
 import os
 from passlib.hash import pbkdf2_sha512
 import random
+import secrets
 import socket
 import sys
 import uuid
@@ -20,12 +22,16 @@ from Core.Text import Text
 # Reference: https://tenzer.dk/generating-subresource-integrity-checksums/
 # openssl req -new -x509 -keyout server.pem -out server.pem -days 365 -nodes
 class Security():
+    passwordRounds = 999999
+    __hasOpenSSL = None
+    __passwordRecord = None
     __vaultDir = Framework.getVaultDir()
     __certificatePemPath = "{0}/Certificate.pem".format(__vaultDir)
     __certificateCrtPath = "{0}/Certificate.crt".format(__vaultDir)
     __passwordPath = "{0}/Password.json".format(__vaultDir)
     __privateKeyPath = "{0}/PrivateKey.pem".format(__vaultDir)
     __publicKeyPath = "{0}/PublicKey.pem".format(__vaultDir)
+    __sessionKeyPath = "{0}/Session.json".format(__vaultDir)
 
     @staticmethod
     def authenticate(path, password=None):
@@ -35,25 +41,27 @@ class Security():
 
     @staticmethod
     def certsAndKeysExist():
-        for path in [Security.__privateKeyPath,
-                     Security.__publicKeyPath,
-                     Security.__certificatePemPath]:
-            if not File.exists(path):
-                return False
-        if Security.hasOpenSSL():
-            return File.exists(Security.__certificateCrtPath)
-        return True
+        return File.exist([Security.__privateKeyPath,
+                           Security.__publicKeyPath,
+                           Security.__certificatePemPath,
+                           Security.__certificateCrtPath])
 
     @staticmethod
-    def createCertsAndKeys(host=None):
+    def createCertsAndKeys(host=None, keyType="RSA"):
         if host is None:
             host = socket.gethostname()
         File.deletes([Security.__privateKeyPath,
                       Security.__publicKeyPath,
                       Security.__certificatePemPath,
                       Security.__certificateCrtPath])
-        key = OpenSSL.crypto.PKey()
-        key.generate_key(OpenSSL.crypto.TYPE_RSA, 2048)
+        if keyType.upper() == "ECDSA":
+            key = OpenSSL.crypto.PKey.from_cryptography_key(
+                ec.generate_private_key(ec.SECP256R1()))
+        elif keyType.upper() == "RSA":
+            key = OpenSSL.crypto.PKey()
+            key.generate_key(OpenSSL.crypto.TYPE_RSA, 2048)
+        else:
+            Error.raiseException("Unsupported key type: {0}".format(keyType))
         certificate = OpenSSL.crypto.X509()
         certificate.get_subject().C = "US"
         certificate.get_subject().ST = "Oregon"
@@ -70,12 +78,12 @@ class Security():
         privateKeyData = OpenSSL.crypto.dump_privatekey(OpenSSL.crypto.FILETYPE_PEM, key)
         publicKeyData = OpenSSL.crypto.dump_publickey(OpenSSL.crypto.FILETYPE_PEM, key)
         certificateData = OpenSSL.crypto.dump_certificate(OpenSSL.crypto.FILETYPE_PEM, certificate)
+        certificateDerData = OpenSSL.crypto.dump_certificate(OpenSSL.crypto.FILETYPE_ASN1, certificate)
         File.setContent(Security.__privateKeyPath, privateKeyData, asBytes=True, mkdirs=True)
         File.setContent(Security.__publicKeyPath, publicKeyData, asBytes=True, mkdirs=True)
         File.setContent(Security.__certificatePemPath, certificateData, asBytes=True, mkdirs=True)
-        if Security.hasOpenSSL():
-            ret = os.system("openssl x509 -outform der -in {0} -out {1}".format(
-                            Security.__certificatePemPath, Security.__certificateCrtPath))
+        File.setContent(Security.__certificateCrtPath, certificateDerData, asBytes=True, mkdirs=True)
+
     @staticmethod
     def createPassword():
         Security.deletePassword()
@@ -118,22 +126,82 @@ class Security():
     def getRandomToken():
         return  uuid.uuid4()
 
+    @staticmethod
+    def getSessionKey(name="Key"):
+        keys = {}
+        if File.exists(Security.__sessionKeyPath):
+            keys = File.getContent(Security.__sessionKeyPath, asJson=True)
+        if name not in keys:
+            keys[name] = secrets.token_hex(32)
+            File.setContent(Security.__sessionKeyPath, keys, asJson=True, mkdirs=True)
+        return keys[name]
+
     @staticmethod
     def getSubresourceIntegrityHash(path):
-        content = File.getContent(path)
-        hash = hashlib.sha512(content.encode("utf-8")).digest()
+        content = File.getContent(path, asBytes=True)
+        hash = hashlib.sha512(content).digest()
         return "sha512-{}".format(base64.b64encode(hash).decode())
 
+    @staticmethod
+    def getSubresourceIntegrityHashes(paths, manifestPath=None):
+        manifest = {}
+        if manifestPath is not None and File.exists(manifestPath):
+            try:
+                manifest = File.getContent(manifestPath, asJson=True)
+            except ValueError:
+                manifest = {}
+        hashes = {}
+        changed = False
+        for path in paths:
+            stat = os.stat(path)
+            entry = manifest.get(path)
+            if entry is None or entry["MTime"] != stat.st_mtime_ns or entry["Size"] != stat.st_size:
+                entry = {
+                    "MTime": stat.st_mtime_ns,
+                    "Size": stat.st_size,
+                    "Hash": Security.getSubresourceIntegrityHash(path)
+                }
+                manifest[path] = entry
+                changed = True
+            hashes[path] = entry["Hash"]
+        for path in list(manifest):
+            if path not in hashes:
+                del manifest[path]
+                changed = True
+        if changed and manifestPath is not None:
+            File.setContent(manifestPath, manifest, asJson=True, mkdirs=True)
+        return hashes
+
     @staticmethod
     def hasOpenSSL():
-        if File.find("openssl") is not None:
-            return True
-        ret = os.system("openssl version")
-        return ret == 0
+        if Security.__hasOpenSSL is None:
+            Security.__hasOpenSSL = File.finds(["openssl", "openssl.exe"]) is not None
+        return Security.__hasOpenSSL
+
+    @staticmethod
+    def getPasswordHasher(rounds=None):
+        if rounds is None:
+            rounds = Security.passwordRounds
+        return pbkdf2_sha512.using(rounds=rounds, salt_size=64,
+                                   min_desired_rounds=rounds, max_desired_rounds=rounds)
+
+    @staticmethod
+    def getPasswordRecord(path):
+        mtime = os.stat(path).st_mtime_ns
+        cached = Security.__passwordRecord
+        if cached is not None and cached[0] == path and cached[1] == mtime:
+            return cached[2]
+        record = File.getContent(path, asJson=True)
+        Security.__passwordRecord = (path, mtime, record)
+        return record
+
+    @staticmethod
+    def hashAndSaltPassword(password, rounds=None):
+        return Security.getPasswordHasher(rounds).hash(password)
 
     @staticmethod
-    def hashAndSaltPassword(password):
-        return pbkdf2_sha512.encrypt(password, rounds=999999, salt_size=64)
+    def needsRehash(hash):
+        return Security.getPasswordHasher().needs_update(hash)
 
     @staticmethod
     def hasPasswordFile():
@@ -172,4 +240,9 @@ class Security():
 
     @staticmethod
     def verifyPasswordByFile(password, path):
-        return Security.verifyPassword(password, File.getContent(path, asJson=True)["Password"])
\ No newline at end of file
+        hash = Security.getPasswordRecord(path)["Password"]
+        if not Security.verifyPassword(password, hash):
+            return False
+        if Security.needsRehash(hash):
+            File.setContent(path, {"Password": Security.hashAndSaltPassword(password)}, asJson=True)
+        return True
\ No newline at end of file
@@ -0,0 +1,96 @@
+from Core.File import File
+
+class SubtitleCue(object):
+    __slots__ = ["Identifier", "Start", "End", "Settings", "Text"]
+
+    def __init__(self, identifier, start, end, settings="", text=None):
+        self.Identifier = identifier
+        self.Start = start
+        self.End = end
+        self.Settings = settings
+        self.Text = [] if text is None else text
+
+class Subtitle(object):
+    formats = ["srt", "vtt"]
+
+    @staticmethod
+    def __formatTime(value, subtitleFormat):
+        if subtitleFormat == "vtt":
+            return value.replace(",", ".")
+        if value.count(":") < 2:
+            value = "00:{0}".format(value)
+        return value.replace(".", ",")
+
+    @staticmethod
+    def getFormat(path):
+        for line in File.iterLines(path):
+            return "vtt" if line.lstrip("\ufeff").startswith("WEBVTT") else "srt"
+        return "srt"
+
+    @staticmethod
+    def iterBlocks(lines):
+        block = []
+        for line in lines:
+            line = line.strip()
+            if line == "":
+                if len(block) > 0:
+                    yield block
+                    block = []
+            else:
+                block.append(line)
+        if len(block) > 0:
+            yield block
+
+    @staticmethod
+    def iterContent(cues, subtitleFormat="srt"):
+        subtitleFormat = subtitleFormat.lower()
+        if subtitleFormat == "vtt":
+            yield "WEBVTT\n"
+        for i, cue in enumerate(cues, 1):
+            if i > 1 or subtitleFormat == "vtt":
+                yield "\n"
+            if subtitleFormat != "vtt":
+                yield "{0}\n".format(i)
+            elif cue.Identifier is not None:
+                yield "{0}\n".format(cue.Identifier)
+            yield "{0} --> {1}".format(Subtitle.__formatTime(cue.Start, subtitleFormat),
+                                       Subtitle.__formatTime(cue.End, subtitleFormat))
+            if subtitleFormat == "vtt" and cue.Settings != "":
+                yield " {0}".format(cue.Settings)
+            yield "\n"
+            for line in cue.Text:
+                yield "{0}\n".format(line)
+
+    @staticmethod
+    def iterCues(lines):
+        for block in Subtitle.iterBlocks(lines):
+            if "-->" in block[0]:
+                identifier, timing, text = None, block[0], block[1:]
+            elif len(block) > 1 and "-->" in block[1]:
+                identifier, timing, text = block[0].lstrip("\ufeff"), block[1], block[2:]
+            else:
+                continue
+            start, separator, rest = timing.partition("-->")
+            rest = rest.split(None, 1)
+            if len(rest) < 1:
+                continue
+            yield SubtitleCue(identifier, start.strip(), rest[0], rest[1] if len(rest) > 1 else "", text)
+
+    @staticmethod
+    def iterText(cues):
+        separator = ""
+        for cue in cues:
+            if len(cue.Text) > 0:
+                yield separator
+                yield "\n".join(cue.Text)
+                separator = "\n\n"
+
+    @staticmethod
+    def iterTranslated(cues, blocks):
+        blocks = iter(blocks)
+        for cue in cues:
+            if len(cue.Text) > 0:
+                text = next(blocks, None)
+                if text is not None:
+                    cue.Text = text
+            yield cue
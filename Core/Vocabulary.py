@@ -0,0 +1,130 @@
+import array
+import sys
+from Core.Error import Error
+
+class VocabularyEntry(object):
+    __slots__ = ["L1", "L2", "Pos", "Cnt"]
+
+    def __init__(self, l1, l2, pos, cnt):
+        self.L1 = l1
+        self.L2 = l2
+        self.Pos = pos
+        self.Cnt = cnt
+
+    def __eq__(self, other):
+        return isinstance(other, VocabularyEntry) and self.toTuple() == other.toTuple()
+
+    def __repr__(self):
+        return "VocabularyEntry({0!r}, {1!r}, {2!r}, {3!r})".format(self.L1, self.L2, self.Pos, self.Cnt)
+
+    def toDict(self):
+        return {"L1": self.L1, "L2": self.L2, "Pos": self.Pos, "Cnt": str(self.Cnt)}
+
+    def toTuple(self):
+        return (self.L1, self.L2, self.Pos, self.Cnt)
+
+class Vocabulary(object):
+    __slots__ = ["l1", "l2", "pos", "cnt"]
+    sorts = ["Cnt", "L1", "L2", "Pos"]
+
+    def __init__(self):
+        self.l1 = []
+        self.l2 = []
+        self.pos = []
+        self.cnt = array.array("q")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        return VocabularyEntry(self.l1[index], self.l2[index], self.pos[index], self.cnt[index])
+
+    def __iter__(self):
+        for row in zip(self.l1, self.l2, self.pos, self.cnt):
+            yield VocabularyEntry(*row)
+
+    def __len__(self):
+        return len(self.l1)
+
+    def append(self, l1, l2, pos, cnt):
+        self.l1.append(l1)
+        self.l2.append(l2)
+        self.pos.append(sys.intern(pos))
+        self.cnt.append(Vocabulary.__getCnt(l1, cnt))
+
+    def filter(self, pos=None, minCnt=None, maxCnt=None, predicate=None):
+        indexes = range(len(self))
+        if pos is not None:
+            pos = frozenset([pos]) if isinstance(pos, str) else frozenset(pos)
+            indexes = [i for i in indexes if self.pos[i] in pos]
+        if minCnt is not None:
+            indexes = [i for i in indexes if self.cnt[i] >= minCnt]
+        if maxCnt is not None:
+            indexes = [i for i in indexes if self.cnt[i] <= maxCnt]
+        if predicate is not None:
+            indexes = [i for i in indexes if predicate(self[i])]
+        return self.take(indexes)
+
+    @staticmethod
+    def fromColumns(columns):
+        vocabulary = Vocabulary()
+        vocabulary.l1 = list(columns["L1"])
+        vocabulary.l2 = list(columns["L2"])
+        vocabulary.pos = [sys.intern(pos) for pos in columns["Pos"]]
+        vocabulary.cnt = array.array("q", (Vocabulary.__getCnt(l1, cnt)
+                                           for l1, cnt in zip(columns["L1"], columns["Cnt"])))
+        return vocabulary
+
+    @staticmethod
+    def fromDicts(words):
+        vocabulary = Vocabulary()
+        for word in words:
+            vocabulary.append(word["L1"], word["L2"], word["Pos"], word["Cnt"])
+        return vocabulary
+
+    @staticmethod
+    def fromRows(rows):
+        vocabulary = Vocabulary()
+        for l1, l2, pos, cnt in rows:
+            vocabulary.append(l1, l2, pos, cnt)
+        return vocabulary
+
+    @staticmethod
+    def __getCnt(l1, cnt):
+        try:
+            return int(cnt)
+        except (TypeError, ValueError):
+            Error.raiseException("Invalid vocabulary count '{0}' for '{1}'".format(cnt, l1))
+
+    def getColumns(self):
+        return {"L1": list(self.l1), "L2": list(self.l2), "Pos": list(self.pos), "Cnt": self.cnt.tolist()}
+
+    def getPosTags(self):
+        return sorted(set(self.pos))
+
+    def sort(self, by, reverse=False):
+        if by == "Cnt":
+            key = self.cnt.__getitem__
+        elif by == "Pos":
+            key = lambda i: (self.pos[i], -self.cnt[i])
+        elif by in ["L1", "L2"]:
+            keys = [word.lower() for word in (self.l1 if by == "L1" else self.l2)]
+            key = keys.__getitem__
+        else:
+            return self.take(reversed(range(len(self)))) if reverse else self.take(range(len(self)))
+        return self.take(sorted(range(len(self)), key=key, reverse=reverse))
+
+    def take(self, indexes):
+        indexes = list(indexes)
+        vocabulary = Vocabulary()
+        vocabulary.l1 = [self.l1[i] for i in indexes]
+        vocabulary.l2 = [self.l2[i] for i in indexes]
+        vocabulary.pos = [self.pos[i] for i in indexes]
+        vocabulary.cnt = array.array("q", [self.cnt[i] for i in indexes])
+        return vocabulary
+
+    def toDicts(self):
+        return [{"L1": l1, "L2": l2, "Pos": pos, "Cnt": str(cnt)}
+                for l1, l2, pos, cnt in zip(self.l1, self.l2, self.pos, self.cnt)]
+
+    def toRows(self):
+        return list(zip(self.l1, self.l2, self.pos, self.cnt))
@@ -1,56 +1,542 @@
 from beaker.middleware import SessionMiddleware
 import bottle
 #from bottle_sslify import SSLify
+import collections
+import concurrent.futures
+import email.utils
+import gzip
+import hashlib
 import json
+import mimetypes
+import os
 import re
+import socket
+import socketserver
 import ssl
 import sys
 import threading
 import time
 import webbrowser
-from wsgiref.simple_server import make_server, WSGIRequestHandler
+import zlib
+from wsgiref.simple_server import make_server, WSGIRequestHandler, WSGIServer
+try:
+    import brotli
+except ImportError:
+    brotli = None
+from Core.Cfg import CfgWatcher
 from Core.Database import Database
 from Core.Directory import Directory
+from Core.Error import Error
 from Core.File import File
 from Core.Framework import Framework
 from Core.Msg import Msg
 from Core.Security import Security
 from Core.Text import Text
+from Core.Vocabulary import Vocabulary
+
+class WebThreadingServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class WebSecureThreadingServer(WebThreadingServer):
+
+    def finish_request(self, request, client_address):
+        try:
+            request.do_handshake()
+        except (OSError, ssl.SSLError):
+            return
+        super(WebSecureThreadingServer, self).finish_request(request, client_address)
+
+    def get_request(self):
+        sock, address = super(WebSecureThreadingServer, self).get_request()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        context = WebSecurity.getSSLContext()
+        return context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False), address
+
+    def service_actions(self):
+        super(WebSecureThreadingServer, self).service_actions()
+        WebSecurity.checkCertificate()
+
+
+class WebServer(bottle.ServerAdapter):
+
+    serverClass = WebThreadingServer
+
+
+    def __init__(self, *args, **kwargs):
+        super(WebServer, self).__init__(*args, **kwargs)
+        self._server = None
+
+    def getServer(self, handler):
+        if self.quiet:
+            class QuietHandler(WSGIRequestHandler):
+                def log_request(*args, **kw): pass
+            self.options['handler_class'] = QuietHandler
+        return make_server(self.host, self.port, handler,
+                           server_class=self.serverClass, **self.options)
+
+    def run(self, handler):
+        self._server = self.getServer(handler)
+        self._server.serve_forever()
 
 # Reference: http://www.socouldanyone.com/2014/01/bottle-with-ssl.html
 # Use: C:/Program Files (x86)/Google/Chrome/Application/chrome.exe %s
-class WebSecurity(bottle.ServerAdapter):
+class WebSecurity(WebServer):
+
+    ciphers = "ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:!aNULL:!MD5:!DSS"
+    context = None
+    contextCheckInterval = 5
+    contextCheckedAt = 0
+    contextLock = threading.Lock()
+    contextVersion = None
+    serverClass = WebSecureThreadingServer
+    subresourceIntegrityHashes = None
 
     def __init__(self, *args, **kwargs):
         super(WebSecurity, self).__init__(*args, **kwargs)
-        self._server = None
+
+    @staticmethod
+    def checkCertificate():
+        now = time.monotonic()
+        if now - WebSecurity.contextCheckedAt < WebSecurity.contextCheckInterval:
+            return False
+        WebSecurity.contextCheckedAt = now
+        try:
+            if WebSecurity.getCertificateVersion() == WebSecurity.contextVersion:
+                return False
+            WebSecurity.loadSSLContext()
+        except (OSError, ssl.SSLError) as e:
+            Msg.showWarning("Keeping current certificate, reload failed: {0}".format(e))
+            return False
+        Msg.show("Reloaded certificate: {0}".format(Security.getCertificatePemPath()))
+        return True
+
+    @staticmethod
+    def createSSLContext():
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.minimum_version = ssl.TLSVersion.TLSv1_2
+        context.options |= ssl.OP_NO_COMPRESSION | ssl.OP_CIPHER_SERVER_PREFERENCE
+        context.options &= ~ssl.OP_NO_TICKET
+        context.set_ciphers(WebSecurity.ciphers)
+        context.set_alpn_protocols(["http/1.1"])
+        context.load_cert_chain(certfile=Security.getCertificatePemPath(),
+                                keyfile=Security.getPrivateKeyPath())
+        return context
+
+    @staticmethod
+    def getCertificateVersion():
+        return (os.stat(Security.getCertificatePemPath()).st_mtime_ns,
+                os.stat(Security.getPrivateKeyPath()).st_mtime_ns)
+
+    @staticmethod
+    def getSSLContext():
+        if WebSecurity.context is None:
+            WebSecurity.loadSSLContext()
+        return WebSecurity.context
+
+    @staticmethod
+    def loadSSLContext():
+        with WebSecurity.contextLock:
+            version = WebSecurity.getCertificateVersion()
+            context = WebSecurity.createSSLContext()
+            WebSecurity.context = context
+            WebSecurity.contextVersion = version
+        return context
 
     @staticmethod
     def getSubresourceIntegrityHashes(displayValues=False):
-        sriHashes = {}
+        if WebSecurity.subresourceIntegrityHashes is None:
+            paths = []
+            webDir = Framework.getWebDir()
+            for subDir in ["Css", "Js"]:
+                paths.extend(Directory.getFiles("{0}/{1}".format(webDir, subDir)))
+            manifestPath = "{0}/SubresourceIntegrity.json".format(Framework.getDataDir())
+            WebSecurity.subresourceIntegrityHashes = \
+                Security.getSubresourceIntegrityHashes(paths, manifestPath)
+        if displayValues:
+            for path, sriHash in WebSecurity.subresourceIntegrityHashes.items():
+                print("\n{0}\n{1}\n".format(path, sriHash))
+        return WebSecurity.subresourceIntegrityHashes
+
+    def run(self, handler):
+        WebSecurity.loadSSLContext()
+        super(WebSecurity, self).run(handler)
+
+class WebAsset(object):
+
+    assets = {}
+    compressibleTypes = ["application/javascript", "application/json", "image/svg+xml", "text/"]
+    immutableCacheControl = "public, max-age=31536000, immutable"
+    revalidateCacheControl = "no-cache"
+
+    @staticmethod
+    def build():
+        assets = {}
         webDir = Framework.getWebDir()
-        for subDir in ["Css", "Js"]:
+        sriHashes = WebSecurity.getSubresourceIntegrityHashes()
+        for subDir in ["Css", "Img", "Js"]:
             for path in Directory.getFiles("{0}/{1}".format(webDir, subDir)):
-                sriHashes[path] = Security.getSubresourceIntegrityHash(path)
-                if displayValues:
-                    print("\n{0}\n{1}\n".format(path, sriHashes[path]))
+                name = "{0}/{1}".format(subDir, File.getBasename(path))
+                assets[name] = WebAsset.__buildAsset(name, path, sriHashes.get(path, ""))
+        WebAsset.assets = assets
+
+    @staticmethod
+    def __buildAsset(name, path, integrity):
+        content = File.getContent(path, asBytes=True)
+        digest = hashlib.sha256(content).hexdigest()
+        fingerprint = digest[:16]
+        root, ext = os.path.splitext(name)
+        contentType = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        encodings = {}
+        if WebAsset.isCompressible(contentType):
+            encodings["gzip"] = gzip.compress(content, 9)
+            if brotli is not None:
+                encodings["br"] = brotli.compress(content)
+            for encoding in list(encodings):
+                if len(encodings[encoding]) >= len(content):
+                    del encodings[encoding]
+        return {
+            "Content": content,
+            "ContentType": contentType,
+            "Digest": digest[:32],
+            "Encodings": encodings,
+            "Fingerprint": fingerprint,
+            "Integrity": integrity,
+            "Path": path,
+            "Url": "/Web/{0}.{1}{2}".format(root, fingerprint, ext)
+        }
+
+    @staticmethod
+    def getAcceptedEncodings(header):
+        encodings = []
+        if Text.isNothing(header):
+            return encodings
+        for token in header.split(","):
+            params = token.strip().split(";")
+            encoding = params[0].strip().lower()
+            quality = 1.0
+            for param in params[1:]:
+                param = param.strip()
+                if param.startswith("q="):
+                    try:
+                        quality = float(param[2:])
+                    except ValueError:
+                        quality = 0.0
+            if quality > 0 and encoding != "":
+                encodings.append(encoding)
+        return encodings
+
+    @staticmethod
+    def getAsset(subDir, path):
+        name = "{0}/{1}".format(subDir, path)
+        asset = WebAsset.assets.get(name)
+        if asset is not None:
+            return asset, None
+        root, ext = os.path.splitext(name)
+        root, fingerprint = os.path.splitext(root)
+        asset = WebAsset.assets.get("{0}{1}".format(root, ext))
+        if asset is None:
+            return None, None
+        return asset, fingerprint[1:]
+
+    @staticmethod
+    def getIntegrity(name):
+        asset = WebAsset.assets.get(name)
+        if asset is not None and asset["Integrity"] != "":
+            return asset["Integrity"]
+        path = "{0}/{1}".format(Framework.getWebDir(), name)
+        return WebSecurity.getSubresourceIntegrityHashes().get(path, "")
+
+    @staticmethod
+    def getUrl(name):
+        asset = WebAsset.assets.get(name)
+        if asset is None:
+            return "/Web/{0}".format(name)
+        return asset["Url"]
+
+    @staticmethod
+    def isCompressible(contentType):
+        for compressibleType in WebAsset.compressibleTypes:
+            if contentType.startswith(compressibleType):
+                return True
+        return False
+
+    @staticmethod
+    def isNotModified(etag):
+        header = bottle.request.headers.get("If-None-Match")
+        if Text.isNothing(header):
+            return False
+        for token in header.split(","):
+            token = token.strip()
+            if token.startswith("W/"):
+                token = token[2:]
+            if token == "*" or token == etag:
+                return True
+        return False
+
+    @staticmethod
+    def serve(subDir, path):
+        asset, fingerprint = WebAsset.getAsset(subDir, path)
+        if asset is None:
+            return bottle.static_file(path, root="{0}/{1}".format(Framework.getWebDir(), subDir))
+        encoding = None
+        for accepted in WebAsset.getAcceptedEncodings(
+            bottle.request.headers.get("Accept-Encoding")):
+            if accepted in asset["Encodings"]:
+                encoding = accepted
+                break
+        etag = "\"{0}\"".format(asset["Digest"])
+        if encoding is not None:
+            etag = "\"{0}-{1}\"".format(asset["Digest"], encoding)
+        bottle.response.set_header("ETag", etag)
+        bottle.response.set_header("Vary", "Accept-Encoding")
+        if fingerprint == asset["Fingerprint"]:
+            bottle.response.set_header("Cache-Control", WebAsset.immutableCacheControl)
+        else:
+            bottle.response.set_header("Cache-Control", WebAsset.revalidateCacheControl)
+        if WebAsset.isNotModified(etag):
+            bottle.response.status = 304
+            return b""
+        bottle.response.content_type = asset["ContentType"]
+        if encoding is None:
+            return asset["Content"]
+        bottle.response.set_header("Content-Encoding", encoding)
+        return asset["Encodings"][encoding]
+
+
+class WebApiCache(object):
+
+    entries = collections.OrderedDict()
+    limit = 64
+    lock = threading.Lock()
+
+    @staticmethod
+    def get(key, version):
+        with WebApiCache.lock:
+            entry = WebApiCache.entries.get(key)
+            if entry is None:
+                return None
+            if entry["Version"] != version:
+                del WebApiCache.entries[key]
+                return None
+            WebApiCache.entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def getETag(content):
+        return "\"{0}\"".format(hashlib.sha1(content.encode("utf-8")).hexdigest())
+
+    @staticmethod
+    def getVersion():
+        try:
+            return os.stat(Database.path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def invalidate(projectID=None):
+        with WebApiCache.lock:
+            if projectID is None:
+                WebApiCache.entries.clear()
+                return
+            for key in list(WebApiCache.entries):
+                if key[1] is None or key[1] == projectID:
+                    del WebApiCache.entries[key]
+
+    @staticmethod
+    def set(key, version, content):
+        entry = {
+            "Content": content,
+            "Version": version
+        }
+        if isinstance(content, str):
+            lastModified = time.time()
+            if version is not None:
+                lastModified = version / 1e9
+            entry["ETag"] = WebApiCache.getETag(content)
+            entry["LastModified"] = email.utils.formatdate(lastModified, usegmt=True)
+        with WebApiCache.lock:
+            WebApiCache.entries[key] = entry
+            WebApiCache.entries.move_to_end(key)
+            while len(WebApiCache.entries) > WebApiCache.limit:
+                WebApiCache.entries.popitem(last=False)
+        return entry
+
+
+class WebCompression(object):
+
+    compressibleTypes = ["application/javascript", "application/json", "application/xml", "text/"]
+    level = 6
+    minimumSize = 1024
+
+    def __init__(self, app, minimumSize=None, level=None):
+        self.app = app
+        self.minimumSize = WebCompression.minimumSize if minimumSize is None else minimumSize
+        self.level = WebCompression.level if level is None else level
+
+    def __call__(self, environ, startResponse):
+        acceptedEncodings = WebAsset.getAcceptedEncodings(environ.get("HTTP_ACCEPT_ENCODING"))
+        encoding = None
+        if brotli is not None and "br" in acceptedEncodings:
+            encoding = "br"
+        elif "gzip" in acceptedEncodings:
+            encoding = "gzip"
+        if encoding is None or environ.get("REQUEST_METHOD") == "HEAD":
+            return self.app(environ, startResponse)
+        state = {"compress": False}
+
+        def startCompressedResponse(status, headers, excInfo=None):
+            if self.__isCompressible(status, headers):
+                state["compress"] = True
+                headers = [self.__weakenHeader(name, value) for name, value in headers
+                           if name.lower() != "content-length"]
+                headers.append(("Content-Encoding", encoding))
+                headers.append(("Vary", "Accept-Encoding"))
+            return startResponse(status, headers, excInfo)
+
+        body = self.app(environ, startCompressedResponse)
+        if not state["compress"]:
+            return body
+        return self.__compress(body, encoding)
+
+    def __compress(self, body, encoding):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=min(self.level, 11))
+            compress = compressor.process
+            flush = compressor.finish
+        else:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            compress = compressor.compress
+            flush = compressor.flush
+        try:
+            for chunk in body:
+                if not chunk:
+                    continue
+                chunk = compress(chunk)
+                if chunk:
+                    yield chunk
+            yield flush()
+        finally:
+            if hasattr(body, "close"):
+                body.close()
+
+    def __weakenHeader(self, name, value):
+        if name.lower() == "etag" and not value.startswith("W/"):
+            return (name, "W/{0}".format(value))
+        return (name, value)
+
+    def __isCompressible(self, status, headers):
+        if not status.startswith("200"):
+            return False
+        contentType = ""
+        for name, value in headers:
+            name = name.lower()
+            if name == "content-encoding":
+                return False
+            if name == "content-type":
+                contentType = value.lower()
+            if name == "content-length" and Text.isInt(value) and int(value) < self.minimumSize:
+                return False
+        for compressibleType in WebCompression.compressibleTypes:
+            if contentType.startswith(compressibleType):
+                return True
+        return False
+
+
+class WebLogin(object):
+
+    attempts = {}
+    attemptsLimit = 5
+    attemptsWindow = 60
+    lock = threading.Lock()
+    verifiers = 2
+    verifierSlots = threading.BoundedSemaphore(verifiers)
+    verifierExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=verifiers)
+    verifierTimeout = 30
+
+    @staticmethod
+    def clearAttempts(client):
+        with WebLogin.lock:
+            WebLogin.attempts.pop(client, None)
+
+    @staticmethod
+    def isRateLimited(client):
+        now = time.monotonic()
+        with WebLogin.lock:
+            for name in list(WebLogin.attempts):
+                WebLogin.attempts[name] = [attempt for attempt in WebLogin.attempts[name]
+                                           if now - attempt < WebLogin.attemptsWindow]
+                if len(WebLogin.attempts[name]) < 1:
+                    del WebLogin.attempts[name]
+            attempts = WebLogin.attempts.setdefault(client, [])
+            if len(attempts) >= WebLogin.attemptsLimit:
+                return True
+            attempts.append(now)
+            return False
+
+    @staticmethod
+    def verify(password):
+        if not WebLogin.verifierSlots.acquire(blocking=False):
+            return None
+        try:
+            passwordPath = "{0}/Password.json".format(Framework.getVaultDir())
+            future = WebLogin.verifierExecutor.submit(
+                Security.verifyPasswordByFile, password, passwordPath)
+        except Exception:
+            WebLogin.verifierSlots.release()
+            raise
+        future.add_done_callback(lambda future: WebLogin.verifierSlots.release())
+        try:
+            return future.result(WebLogin.verifierTimeout)
+        except concurrent.futures.TimeoutError:
+            return None
+
+
+class WebTemplate(object):
+
+    templates = {}
+    fragments = {}
+    fragmentsLimit = 256
+
+    @staticmethod
+    def compile():
+        templates = {}
+        templateDir = "{0}/Tpl".format(Framework.getWebDir())
+        for path in Directory.getFiles(templateDir):
+            if not path.endswith(".tpl"):
+                continue
+            template = bottle.SimpleTemplate(source=File.getContent(path),
+                                             lookup=[templateDir])
+            template.co  # Compile the template code now instead of on the first request
+            templates[File.getName(path)] = template
+        WebTemplate.templates = templates
+        WebTemplate.fragments = {}
+
+    @staticmethod
+    def render(name, replace={}):
+        if len(WebTemplate.templates) < 1:
+            WebTemplate.compile()
+        if name not in WebTemplate.templates:
+            Error.raiseException("Unknown web template: {0}".format(name))
+        return WebTemplate.templates[name].render(replace)
+
+    @staticmethod
+    def renderFragment(key, renderer):
+        fragment = WebTemplate.fragments.get(key)
+        if fragment is None:
+            fragment = renderer()
+            if len(WebTemplate.fragments) >= WebTemplate.fragmentsLimit:
+                WebTemplate.fragments.clear()
+            WebTemplate.fragments[key] = fragment
+        return fragment
 
-    def run(self, handler):
-        if self.quiet:
-            class QuietHandler(WSGIRequestHandler):
-                def log_request(*args, **kw): pass
-            self.options['handler_class'] = QuietHandler
-        srv = make_server(self.host, self.port, handler, **self.options)
-        srv.socket = ssl.wrap_socket (
-            srv.socket,
-            keyfile = Security.getPrivateKeyPath(),
-            certfile = Security.getCertificatePemPath(),
-            server_side = True)
-        srv.serve_forever()
 
 class Web(object):
 
+    cfgWatcher = None
     cocoscats = NotImplemented
+    sessionKey = "cocoscats.session"
+    sessionTimeout = 300
     useHttps = NotImplemented
     useAuthentication = NotImplemented
     url = NotImplemented
@@ -60,15 +546,16 @@ class Web(object):
         Web.cocoscats = cocoscats
         Web.useHttps = Text.isTrue(Web.cocoscats.cfg["Web"]["UseHttps"])
         Web.useAuthentication = Text.isTrue(Web.cocoscats.cfg["Web"]["UseAuthentication"])
-        sessionOptions = {
-            "session.type": "memory",
-            "session.cookie_expires": 300,
-            "session.auto": True
-        }
+        sessionOptions = Web.getSessionOptions()
+        if "PasswordRounds" in Web.cocoscats.cfg["Web"]:
+            Security.passwordRounds = int(Web.cocoscats.cfg["Web"]["PasswordRounds"])
 
         if Text.isTrue(Web.cocoscats.cfg["Web"]["Debug"]):
             WebSecurity.getSubresourceIntegrityHashes(True)
 
+        WebAsset.build()
+        WebTemplate.compile()
+
         Web.setupPassword()
         Web.setupCertificate()
 
@@ -82,7 +569,7 @@ class Web(object):
 
             threading.Thread(target=bottle.run,
                 kwargs=dict(
-                app = SessionMiddleware(bottle.app(), sessionOptions),
+                app = WebCompression(SessionMiddleware(bottle.app(), sessionOptions)),
                 debug = Text.toTrueOrFalse(Web.cocoscats.cfg["Web"]["Debug"]),
                 reloader = Text.toTrueOrFalse(Web.cocoscats.cfg["Web"]["Reloader"]),
                 server = server
@@ -92,14 +579,18 @@ class Web(object):
             Web.url = "{0}://{1}:{2}/".format(Web.scheme,
                                               Web.cocoscats.cfg["Web"]["Host"],
                                               Web.cocoscats.cfg["Web"]["Port"])
+            server = WebServer(host=Web.cocoscats.cfg["Web"]["Host"],
+                               port=Web.cocoscats.cfg["Web"]["Port"])
             threading.Thread(target=bottle.run,
                 kwargs=dict(
-                app = SessionMiddleware(bottle.app(), sessionOptions),
+                app = WebCompression(SessionMiddleware(bottle.app(), sessionOptions)),
                 debug = Text.toTrueOrFalse(Web.cocoscats.cfg["Web"]["Debug"]),
-                host = Web.cocoscats.cfg["Web"]["Host"],
-                port = Web.cocoscats.cfg["Web"]["Port"],
-                reloader = Text.toTrueOrFalse(Web.cocoscats.cfg["Web"]["Reloader"])
+                reloader = Text.toTrueOrFalse(Web.cocoscats.cfg["Web"]["Reloader"]),
+                server = server
                 )).start()
+        if Text.isTrue(Web.cocoscats.cfg["Web"].get("ReloadCfg", "False")):
+            Web.cfgWatcher = CfgWatcher(Web.cocoscats.cfgPath, Web.reload)
+            Web.cfgWatcher.start()
         Msg.flush()
         for client in Web.cocoscats.cfg["Web"]["Browser"]:
             if Text.isNothing(client) or client.lower() == "default":
@@ -109,6 +600,52 @@ class Web(object):
                 if webbrowser.get(client).open(Web.url):
                     break
 
+    @staticmethod
+    def getCocoscats():
+        try:
+            return bottle.request.environ.setdefault("cocoscats", Web.cocoscats)
+        except RuntimeError:
+            return Web.cocoscats
+
+    @staticmethod
+    def getSessionOptions():
+        sessionType = Web.cocoscats.cfg["Web"].get("Session", "Memory").lower()
+        sessionOptions = {
+            "session.type": "memory",
+            "session.key": Web.sessionKey,
+            "session.cookie_expires": Web.sessionTimeout,
+            "session.auto": False,
+            "session.save_accessed_time": False,
+            "session.httponly": True,
+            "session.secure": Web.useHttps
+        }
+        if sessionType == "cookie":
+            sessionOptions["session.type"] = "cookie"
+            sessionOptions["session.validate_key"] = Security.getSessionKey()
+            sessionOptions["session.encrypt_key"] = Security.getSessionKey("EncryptKey")
+            sessionOptions["session.data_serializer"] = "json"
+        elif sessionType == "file":
+            sessionDir = "{0}/Session".format(Framework.getDataDir())
+            sessionOptions["session.type"] = "file"
+            sessionOptions["session.data_dir"] = sessionDir
+            sessionOptions["session.lock_dir"] = "{0}/Lock".format(sessionDir)
+        elif sessionType != "memory":
+            Error.raiseException("Unknown web session type: {0}".format(sessionType))
+        return sessionOptions
+
+    @staticmethod
+    def reload():
+        try:
+            cocoscats = Web.cocoscats.reload()
+        except Exception as e:
+            Msg.showWarning("Keeping current cfg. Unable to reload {0}: {1}".format(
+                            Web.cocoscats.cfgPath, str(e)))
+            return False
+        Web.cocoscats = cocoscats
+        WebTemplate.fragments.clear()
+        Msg.show("Reloaded {0}".format(cocoscats.cfgPath))
+        return True
+
     @staticmethod
     def setupCertificate():
         if not Text.isTrue(Web.cocoscats.cfg["Web"]["UseHttps"]):
@@ -116,7 +653,8 @@ class Web(object):
         if Text.isTrue(Web.cocoscats.cfg["Web"]["RefreshCertificate"]):
             Security.deleteCertsAndKeys()
         if not Security.certsAndKeysExist():
-            Security.createCertsAndKeys(Web.cocoscats.cfg["Web"]["Host"])
+            Security.createCertsAndKeys(Web.cocoscats.cfg["Web"]["Host"],
+                                        Web.cocoscats.cfg["Web"].get("CertificateKeyType", "RSA"))
 
     @staticmethod
     def setupPassword():
@@ -145,76 +683,34 @@ class WebApp(object):
     @staticmethod
     def getEditor(content):
         replace = {"content": content}
-        return bottle.template("Web/Tpl/Editor.tpl", replace)
+        return WebTemplate.render("Editor", replace)
 
     @staticmethod
     def getFooter(scripts=""):
-        replace = {"year": "2017", "scripts": scripts}
         year = time.strftime("%Y")
-        if year != replace["year"]:
-            replace["year"] = "{0}-{1}".format(replace["year"], year)
-        return bottle.template("Web/Tpl/Footer.tpl", replace)
+        return WebTemplate.renderFragment(("Footer", scripts, year),
+            lambda: WebApp.__renderFooter(scripts, year))
 
     @staticmethod
     def getHeader(title,  meta="", css="", js=""):
-        replaceHeader = {
-            "title": title,
-            "meta": meta,
-            "css": css,
-            "js": js
-        }
-        replaceMenu = {"LoginStatus": ""}
-        replaceTitle = {"title": title}
+        loginStatus = ""
         if Web.useAuthentication:
-            if Text.isTrue(WebApp.__getSession("Authenticated")):
-                replaceMenu["LoginStatus"] = """ | <a href="/Logout">Logout</a>"""
+            if WebApp.__isAuthenticated():
+                loginStatus = """ | <a href="/Logout">Logout</a>"""
             else:
-                replaceMenu["LoginStatus"] = """ | <a href="/Login">Login</a>"""
-        return """{0}{1}{2}""".format(
-            bottle.template("Web/Tpl/Header.tpl", replaceHeader),
-            bottle.template("Web/Tpl/Menu.tpl", replaceMenu),
-            bottle.template("Web/Tpl/Title.tpl", replaceTitle))
+                loginStatus = """ | <a href="/Login">Login</a>"""
+        return WebTemplate.renderFragment(("Header", title, meta, css, js, loginStatus),
+            lambda: WebApp.__renderHeader(title, meta, css, js, loginStatus))
 
     @staticmethod
     def getNavigation(title, step, pluginName):
-        replace = {
-            "title": title,
-            "step": step,
-            "pluginName": pluginName,
-            "Input": "Input",
-            "Analyzer": "Analyzer",
-            "Translator": "Translator",
-            "Output": "Output",
-            "View": "View"
-        }
-        if title == "Input":
-            replace["Input"] = """<span id="csNavTitle">Input</span>"""
-            replace["Analyzer"] = """<a href="/Analyzer">Analyzer</a>"""
-        elif title == "Analyzer":
-            replace["Input"]  = """<a href="/Input">Input</a>"""
-            replace["Analyzer"] = """<span id="csNavTitle">Analyzer</span>"""
-            replace["Translator"]  = """<a href="/Translator">Translator</a>"""
-        elif title == "Translator":
-            replace["Input"] = """<a href="/Input">Input</a>"""
-            replace["Analyzer"] = """<a href="/Analyzer">Analyzer</a>"""
-            replace["Translator"] = """<span id="csNavTitle">Translator</span>"""
-            replace["Output"] = """<a href="/Output">Output</a>"""
-        elif title == "Output":
-            replace["Input"] = """<a href="/Input">Input</a>"""
-            replace["Analyzer"] = """<a href="/Analyzer">Analyzer</a>"""
-            replace["Translator"] = """<a href="/Translator">Translator</a>"""
-            replace["Output"] = """<span id="csNavTitle">Output</span>"""
-            replace["View"] = """<a href="/View">View</a>"""
-        elif title == "View":
-            replace["Input"] = """<a href="/Input">Input</a>"""
-            replace["Analyzer"] = """<a href="/Analyzer">Analyzer</a>"""
-            replace["Translator"] = """<a href="/Translator">Translator</a>"""
-            replace["Output"] = """<a href="/Output">Output</a>"""
-            replace["View"] = """<span id="csNavTitle">View</span>"""
-        return bottle.template("Web/Tpl/Navigation.tpl", replace)
+        return WebTemplate.renderFragment(("Navigation", title, step, pluginName),
+            lambda: WebApp.__renderNavigation(title, step, pluginName))
 
     @staticmethod
     def __getSession(name):
+        if bottle.request.get_cookie(Web.sessionKey) is None:
+            return None
         session = bottle.request.environ.get('beaker.session')
         if name not in session:
             return None
@@ -222,28 +718,79 @@ class WebApp(object):
 
     @staticmethod
     def __isAuthenticated():
-        return Text.isTrue(WebApp.__getSession("Authenticated"))
+        if not Text.isTrue(WebApp.__getSession("Authenticated")):
+            return False
+        return time.time() - float(WebApp.__getSession("AuthenticatedAt") or 0) < Web.sessionTimeout
 
     @staticmethod
     def __redirect(path, delay=None):
         url = "{0}://{1}:{2}{3}".format(Web.scheme,
-                                      Web.cocoscats.cfg["Web"]["Host"],
-                                      Web.cocoscats.cfg["Web"]["Port"],
+                                      Web.getCocoscats().cfg["Web"]["Host"],
+                                      Web.getCocoscats().cfg["Web"]["Port"],
                                       path)
         if delay is None:
             bottle.redirect(url)
             return
         bottle.response.set_header("REFRESH", "{0};{1}".format(delay, url))
 
+    @staticmethod
+    def __renderFooter(scripts, year):
+        replace = {
+            "year": "2017",
+            "scripts": scripts,
+            "jqueryUrl": WebAsset.getUrl("Js/Jquery.js"),
+            "jqueryIntegrity": WebAsset.getIntegrity("Js/Jquery.js"),
+            "cocoscatsUrl": WebAsset.getUrl("Js/Cocoscats.js"),
+            "cocoscatsIntegrity": WebAsset.getIntegrity("Js/Cocoscats.js")
+        }
+        if year != replace["year"]:
+            replace["year"] = "{0}-{1}".format(replace["year"], year)
+        return WebTemplate.render("Footer", replace)
+
+    @staticmethod
+    def __renderHeader(title, meta, css, js, loginStatus):
+        replaceHeader = {
+            "title": title,
+            "meta": meta,
+            "css": css,
+            "js": js,
+            "cssUrl": WebAsset.getUrl("Css/Cocoscats.css"),
+            "cssIntegrity": WebAsset.getIntegrity("Css/Cocoscats.css")
+        }
+        replaceMenu = {"LoginStatus": loginStatus}
+        replaceTitle = {"title": title}
+        return """{0}{1}{2}""".format(
+            WebTemplate.render("Header", replaceHeader),
+            WebTemplate.render("Menu", replaceMenu),
+            WebTemplate.render("Title", replaceTitle))
+
+    @staticmethod
+    def __renderNavigation(title, step, pluginName):
+        replace = {
+            "title": title,
+            "step": step,
+            "pluginName": pluginName
+        }
+        steps = ["Input", "Analyzer", "Translator", "Output", "View"]
+        current = steps.index(title) if title in steps else -1
+        for i, name in enumerate(steps):
+            if current < 0 or i > current + 1:
+                replace[name] = name
+            elif i == current:
+                replace[name] = """<span id="csNavTitle">{0}</span>""".format(name)
+            else:
+                replace[name] = """<a href="/{0}">{0}</a>""".format(name)
+        return WebTemplate.render("Navigation", replace)
+
     @bottle.route("/Analyzer")
     @bottle.route("/Analyzer/<action>", method=["GET","POST"])
     def __runAnalyzer(action=None):
         WebApp.checkAuthentication()
         header = WebApp.getHeader("Analyzer")
         footer = WebApp.getFooter()
-        pluginName = Web.cocoscats.cfg["Workflow"]["Analyzer"]["Plugin"]
+        pluginName = Web.getCocoscats().cfg["Workflow"]["Analyzer"]["Plugin"]
         navigation = WebApp.getNavigation("Analyzer", 2, pluginName)
-        path = Web.cocoscats.frameworkParams["analyzerPath"]
+        path = Web.getCocoscats().frameworkParams["analyzerPath"]
         if not action is None and action == "Save":
             File.setContent(path, bottle.request.forms.Content)
             WebApp.analyzerTainted = True
@@ -251,10 +798,10 @@ class WebApp(object):
             WebApp.outputTainted = False
             return "Successfully saved to '" + path + "'"
         content = None
-        if WebApp.analyzerTainted:
+        if not WebApp.analyzerTainted:
+            content = Web.getCocoscats().runAnalyzer()
+        if content is None:
             content = File.getContent(path)
-        else:
-            content = Web.cocoscats.runAnalyzer()
         editor = WebApp.getEditor(content)
         body = """{0}{1}""".format(navigation, editor)
         return "{0}{1}{2}".format(header, body, footer)
@@ -264,11 +811,11 @@ class WebApp(object):
         WebApp.checkAuthentication()
         header = WebApp.getHeader("Demo")
         footer = WebApp.getFooter()
-        if not Text.isTrue(Web.cocoscats.cfg["Workflow"]["Demo"]["Enable"]):
+        if not Text.isTrue(Web.getCocoscats().cfg["Workflow"]["Demo"]["Enable"]):
             return {"Error": True, "Message": "No demo found"}
-        pluginName = Web.cocoscats.cfg["Workflow"]["Demo"]["Plugin"][0]
-        pluginMethod = Web.cocoscats.cfg["Workflow"]["Demo"]["Method"][0]
-        content = Web.cocoscats.runDemo(pluginName, pluginMethod)
+        pluginName = Web.getCocoscats().cfg["Workflow"]["Demo"]["Plugin"][0]
+        pluginMethod = Web.getCocoscats().cfg["Workflow"]["Demo"]["Method"][0]
+        content = Web.getCocoscats().runDemo(pluginName, pluginMethod)
         body = "Running demo"
         return """  """.format(header, body, footer)
 
@@ -278,9 +825,9 @@ class WebApp(object):
         WebApp.checkAuthentication()
         header = WebApp.getHeader("Input")
         footer = WebApp.getFooter()
-        pluginName = Web.cocoscats.cfg["Workflow"]["Input"]["Plugin"]
+        pluginName = Web.getCocoscats().cfg["Workflow"]["Input"]["Plugin"]
         navigation = WebApp.getNavigation("Input", 1, pluginName)
-        path = Web.cocoscats.frameworkParams["inputPath"]
+        path = Web.getCocoscats().frameworkParams["inputPath"]
         if not action is None and action == "Save":
             File.setContent(path, bottle.request.forms.Content)
             WebApp.inputTainted = True
@@ -289,10 +836,10 @@ class WebApp(object):
             WebApp.outputTainted = False
             return "Successfully saved to '" + path + "'"
         content = None
-        if WebApp.inputTainted:
+        if not WebApp.inputTainted:
+            content = Web.getCocoscats().runInput()
+        if content is None:
             content = File.getContent(path)
-        else:
-            content = Web.cocoscats.runInput()
         editor = WebApp.getEditor(content)
         body = """{0}{1}""".format(navigation, editor)
         return "{0}{1}{2}".format(header, body, footer)
@@ -303,20 +850,22 @@ class WebApp(object):
         WebApp.checkAuthentication()
         header = WebApp.getHeader("Output")
         footer = WebApp.getFooter()
-        pluginName = Web.cocoscats.cfg["Workflow"]["Output"]["Plugin"]
+        pluginName = Web.getCocoscats().cfg["Workflow"]["Output"]["Plugin"]
         navigation = WebApp.getNavigation("Output", 4, pluginName)
-        path = Web.cocoscats.frameworkParams["outputPath"]
+        path = Web.getCocoscats().frameworkParams["outputPath"]
         if not action is None and action == "Save":
             File.setContent(path, bottle.request.forms.Content)
             WebApp.outputTainted = True
-            Web.cocoscats.updateDatabase()
+            Web.getCocoscats().updateDatabase()
+            WebApiCache.invalidate(Web.getCocoscats().getProjectID())
             return "Successfully saved to '" + path + "'"
         content = None
-        if WebApp.outputTainted:
-            content = File.getContent(path)
-        else:
-            content = Web.cocoscats.runOutput()
-            Web.cocoscats.updateDatabase()
+        if not WebApp.outputTainted:
+            content = Web.getCocoscats().runOutput()
+            Web.getCocoscats().updateDatabase()
+            WebApiCache.invalidate(Web.getCocoscats().getProjectID())
+        if content is None:
+            content = File.getContentAsText(path)
         editor = WebApp.getEditor(content)
         body = """{0}{1}""".format(navigation, editor)
         return "{0}{1}{2}".format(header, body, footer)
@@ -329,7 +878,7 @@ class WebApp(object):
         WebApp.analyzerTainted = False
         WebApp.translatorTainted = False
         WebApp.outputTainted = False
-        Web.cocoscats.purgeContent()
+        Web.getCocoscats().purgeContent()
         #bottle.redirect(Web.url)
         WebApp.__redirect("/Input")
 
@@ -339,19 +888,19 @@ class WebApp(object):
         WebApp.checkAuthentication()
         header = WebApp.getHeader("Translator")
         footer = WebApp.getFooter()
-        pluginName = Web.cocoscats.cfg["Workflow"]["Translator"]["Plugin"]
+        pluginName = Web.getCocoscats().cfg["Workflow"]["Translator"]["Plugin"]
         navigation = WebApp.getNavigation("Translator", 3, pluginName)
-        path = Web.cocoscats.frameworkParams["translatorPath"]
+        path = Web.getCocoscats().frameworkParams["translatorPath"]
         if not action is None and action == "Save":
             File.setContent(path, bottle.request.forms.Content)
             WebApp.translatorTainted = True
             WebApp.outputTainted = False
             return "Successfully saved to '" + path + "'"
         content = None
-        if WebApp.translatorTainted:
+        if not WebApp.translatorTainted:
+            content = Web.getCocoscats().runTranslator()
+        if content is None:
             content = File.getContent(path)
-        else:
-            content = Web.cocoscats.runTranslator()
         editor = WebApp.getEditor(content)
         body = """{0}{1}""".format(navigation, editor)
         return "{0}{1}{2}".format(header, body, footer)
@@ -360,24 +909,27 @@ class WebApp(object):
     @bottle.route("/View/<projectID>", method=["GET","POST"])
     def __runView(projectID=None):
         WebApp.checkAuthentication()
-        script = """<script src="/Web/Js/CocoscatsView.js"></script>"""
+        integrity = WebAsset.getIntegrity("Js/CocoscatsView.js")
+        script = """<script src="{0}"{1}></script>""".format(
+            WebAsset.getUrl("Js/CocoscatsView.js"),
+            "" if integrity == "" else " integrity=\"{0}\"".format(integrity))
         header = WebApp.getHeader("View")
         footer = WebApp.getFooter(script)
         navigation = WebApp.getNavigation("View", 4, "View")
         demoHTML = ""
-        if Text.isTrue(Web.cocoscats.cfg["Workflow"]["Demo"]["Enable"]):
-            demoHTML = bottle.template("Web/Tpl/Demo.tpl", {})
+        if Text.isTrue(Web.getCocoscats().cfg["Workflow"]["Demo"]["Enable"]):
+            demoHTML = WebTemplate.render("Demo", {})
         replace = {
-            "projectID": Web.cocoscats.getProjectID(),
+            "projectID": Web.getCocoscats().getProjectID(),
             "runDemo": demoHTML
             }
         body = """{0}{1}""".format(navigation,
-               bottle.template("Web/Tpl/View.tpl", replace))
+               WebTemplate.render("View", replace))
         return "{0}{1}{2}".format(header, body, footer)
 
     @bottle.get("/Web/Css/<path:re:.*\.css>")
     def __setCssPath(path):
-        return bottle.static_file(path, root="Web/Css")
+        return WebAsset.serve("Css", path)
 
     @bottle.get("/Web/Html/<path:re:.*\.html>")
     def __setHtmlPath(path):
@@ -385,11 +937,11 @@ class WebApp(object):
 
     @bottle.get("/Web/Img/<path:re:.*\.(jpg|png)>")
     def __setImgPath(path):
-        return bottle.static_file(path, root="Web/Img")
+        return WebAsset.serve("Img", path)
 
     @bottle.get("/Web/Js/<path:re:.*\.js>")
     def __setJsPath(path):
-        return bottle.static_file(path, root="Web/Js")
+        return WebAsset.serve("Js", path)
 
     @bottle.hook("after_request")
     def __setSecurityHeaders():
@@ -406,8 +958,8 @@ class WebApp(object):
     @staticmethod
     def __setSession(name, value):
         session = bottle.request.environ.get('beaker.session')
-        session.httponly = True
-        session.secure = True
+        if name in session and session[name] == value:
+            return
         session[name] = value
         session.save()
 
@@ -416,24 +968,26 @@ class WebApp(object):
     def __showAdmin():
         WebApp.checkAuthentication()
         replace = {
-            "Browser": Web.cocoscats.cfg["Web"]["Browser"][0],
-            "Debug": Web.cocoscats.cfg["Web"]["Debug"],
-            "Host": Web.cocoscats.cfg["Web"]["Host"],
+            "Browser": Web.getCocoscats().cfg["Web"]["Browser"][0],
+            "Debug": Web.getCocoscats().cfg["Web"]["Debug"],
+            "Host": Web.getCocoscats().cfg["Web"]["Host"],
             "IsAuthenticated": WebApp.__isAuthenticated(),
-            "Port": Web.cocoscats.cfg["Web"]["Port"],
-            "RefreshCertificate": Web.cocoscats.cfg["Web"]["RefreshCertificate"],
-            "RefreshPassword": Web.cocoscats.cfg["Web"]["RefreshPassword"],
-            "Reloader": Web.cocoscats.cfg["Web"]["Reloader"],
-            "UseAuthentication": Web.cocoscats.cfg["Web"]["UseAuthentication"],
-            "UseHttps": Web.cocoscats.cfg["Web"]["UseHttps"],
-            "DatabaseDebug": Web.cocoscats.cfg["Database"]["Debug"],
-            "DatabaseEnable": Web.cocoscats.cfg["Database"]["Enable"],
-            "DatabaseName": Web.cocoscats.cfg["Database"]["Name"],
-            "DatabaseRebuild": Web.cocoscats.cfg["Database"]["Rebuild"]
+            "Port": Web.getCocoscats().cfg["Web"]["Port"],
+            "RefreshCertificate": Web.getCocoscats().cfg["Web"]["RefreshCertificate"],
+            "RefreshPassword": Web.getCocoscats().cfg["Web"]["RefreshPassword"],
+            "ReloadCfg": Web.getCocoscats().cfg["Web"].get("ReloadCfg", "False"),
+            "Reloader": Web.getCocoscats().cfg["Web"]["Reloader"],
+            "Session": Web.getCocoscats().cfg["Web"].get("Session", "Memory"),
+            "UseAuthentication": Web.getCocoscats().cfg["Web"]["UseAuthentication"],
+            "UseHttps": Web.getCocoscats().cfg["Web"]["UseHttps"],
+            "DatabaseDebug": Web.getCocoscats().cfg["Database"]["Debug"],
+            "DatabaseEnable": Web.getCocoscats().cfg["Database"]["Enable"],
+            "DatabaseName": Web.getCocoscats().cfg["Database"]["Name"],
+            "DatabaseRebuild": Web.getCocoscats().cfg["Database"]["Rebuild"]
             }
         return """{0}{1}{2}""".format(
             WebApp.getHeader("Adminstration"),
-            bottle.template("Web/Tpl/Admin.tpl", replace),
+            WebTemplate.render("Admin", replace),
             WebApp.getFooter())
 
         session = bottle.request.environ.get('beaker.session')
@@ -452,7 +1006,7 @@ class WebApp(object):
         WebApp.checkAuthentication()
         return """{0}{1}{2}""".format(
             WebApp.getHeader("RESTful API"),
-            bottle.template("Web/Tpl/Api.tpl", {}),
+            WebTemplate.render("Api", {}),
             WebApp.getFooter())
 
     @bottle.route("/Doc")
@@ -462,7 +1016,7 @@ class WebApp(object):
         WebApp.checkAuthentication()
         return """{0}{1}{2}""".format(
             WebApp.getHeader("Documentation"),
-            bottle.template("Web/Tpl/Doc.tpl", {}),
+            WebTemplate.render("Doc", {}),
             WebApp.getFooter())
 
     @bottle.route("/")
@@ -471,29 +1025,43 @@ class WebApp(object):
         if not Web.useAuthentication or WebApp.__isAuthenticated():
             return """{0}{1}{2}""".format(
                 WebApp.getHeader("Welcome to CoCoScatS"),
-                bottle.template("Web/Tpl/Index.tpl", {}),
+                WebTemplate.render("Index", {"logoUrl": WebAsset.getUrl("Img/cocoscats.png")}),
                 WebApp.getFooter())
         else:
             return """{0}{1}{2}""".format(
                 WebApp.getHeader("Welcome to CoCoScatS"),
-                bottle.template("Web/Tpl/Login.tpl", {}),
+                WebTemplate.render("Login", {"message": ""}),
                 WebApp.getFooter())
 
     @bottle.route("/Login", method=["GET","POST"])
     def __showLogin():
         p = bottle.request.forms.get("password")
+        message = ""
         if p is not None:
-            passwordPath = "{0}/Password.json".format(Framework.getVaultDir())
-            if Security.verifyPasswordByFile(p, passwordPath):
+            client = bottle.request.remote_addr
+            verified = False
+            if WebLogin.isRateLimited(client):
+                bottle.response.status = 429
+                bottle.response.set_header("Retry-After", str(WebLogin.attemptsWindow))
+                message = "Too many login attempts. Please try again later."
+            else:
+                verified = WebLogin.verify(p)
+                if verified is None:
+                    bottle.response.status = 503
+                    bottle.response.set_header("Retry-After", "1")
+                    message = "Login is busy. Please try again."
+            if verified:
+                WebLogin.clearAttempts(client)
                 bottle.request.environ.get('beaker.session').invalidate()
+                WebApp.__setSession("AuthenticatedAt", time.time())
                 WebApp.__setSession("Authenticated", "True")
                 WebApp.__redirect("/")
                 return ""
-            else:
+            elif verified is not None:
                 WebApp.__setSession("authenticated", "False")
         return """{0}{1}{2}""".format(
             WebApp.getHeader("Welcome to CoCoScatS"),
-            bottle.template("Web/Tpl/Login.tpl", {}),
+            WebTemplate.render("Login", {"message": message}),
             WebApp.getFooter())
 
     @bottle.route("/Logout")
@@ -502,11 +1070,14 @@ class WebApp(object):
         WebApp.__redirect("/", 1)
         return """{0}{1}{2}""".format(
             WebApp.getHeader("Goodbye..."),
-            bottle.template("Web/Tpl/Logout.tpl", {}),
+            WebTemplate.render("Logout", {}),
             WebApp.getFooter())
 
 class WebApi(WebApp):
 
+    vocabularyPageSize = 100
+    vocabularyPageSizeLimit = 1000
+
     @staticmethod
     def __exists(projectID):
         WebApi.checkAuthentication()
@@ -532,24 +1103,115 @@ class WebApi(WebApp):
     @bottle.route("/Api/GetPlugins/<pluginType>", method=["GET","POST"])
     def getPlugins(pluginType=None):
         if pluginType == None:
-            return WebApi.__run(Web.cocoscats.getPlugins)
-        return WebApi.__run(Web.cocoscats.getPluginsByType, pluginType)
+            return WebApi.__run(Web.getCocoscats().getPlugins)
+        return WebApi.__run(Web.getCocoscats().getPluginsByType, pluginType)
+
+    @staticmethod
+    def __runCached(name, api, projectID=None):
+        WebApi.checkAuthentication()
+        key = (name, projectID)
+        version = WebApiCache.getVersion()
+        entry = WebApiCache.get(key, version)
+        if entry is None:
+            if projectID is None:
+                content = WebApi.__run(api)
+            elif WebApi.__exists(projectID):
+                content = WebApi.__run(api, projectID)
+            else:
+                return {"Error": True, "Message": "Project ID does not exist: {0}".format(projectID)}
+            entry = WebApiCache.set(key, version, content)
+        return WebApi.__respondCached(entry)
+
+    @staticmethod
+    def __respondCached(entry):
+        bottle.response.content_type = "application/json"
+        bottle.response.set_header("Cache-Control", "no-cache")
+        bottle.response.set_header("ETag", entry["ETag"])
+        bottle.response.set_header("Last-Modified", entry["LastModified"])
+        if WebAsset.isNotModified(entry["ETag"]) or WebApi.__isNotModifiedSince(entry):
+            bottle.response.status = 304
+            return ""
+        return entry["Content"]
+
+    @staticmethod
+    def __isNotModifiedSince(entry):
+        if bottle.request.headers.get("If-None-Match") is not None or entry["Version"] is None:
+            return False
+        since = bottle.request.headers.get("If-Modified-Since")
+        if Text.isNothing(since):
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(since)
+        except (TypeError, ValueError):
+            return False
+        return int(entry["Version"] / 1e9) <= int(since.timestamp())
 
     @bottle.route("/Api/GetProject", method=["GET","POST"])
     @bottle.route("/Api/GetProject/<projectID>", method=["GET","POST"])
     def getProject(projectID=None):
         if projectID is None:
             return {"Error": True, "Message": "You need to specify a project ID"}
-        if WebApi.__exists(projectID):
-            return WebApi.__run(Database.getProject, projectID)
-        return {"Error": True, "Message": "Project ID does not exist: {0}".format(projectID)}
+        if Text.isNothing(bottle.request.query.Vocabulary) or \
+            Text.isTrue(bottle.request.query.Vocabulary):
+            return WebApi.__runCached("GetProject", Database.getProject, projectID)
+        return WebApi.__runCached("GetProjectWithoutVocabulary",
+            lambda projectID: Database.getProject(projectID, False), projectID)
+
+    @staticmethod
+    def __getSortedVocabulary(projectID, sort, order):
+        key = ("GetVocabulary", projectID, sort, order)
+        version = WebApiCache.getVersion()
+        entry = WebApiCache.get(key, version)
+        if entry is not None:
+            return entry["Content"]
+        Database.connect()
+        vocabulary = Database.getVocabulary(projectID)
+        Database.disconnect()
+        if vocabulary is None:
+            return None
+        vocabulary = Vocabulary.fromDicts(vocabulary).sort(sort, order == "desc")
+        WebApiCache.set(key, version, vocabulary)
+        return vocabulary
+
+    @bottle.route("/Api/GetVocabulary", method=["GET","POST"])
+    @bottle.route("/Api/GetVocabulary/<projectID>", method=["GET","POST"])
+    def getVocabulary(projectID=None):
+        if projectID is None:
+            return {"Error": True, "Message": "You need to specify a project ID"}
+        WebApi.checkAuthentication()
+        query = bottle.request.query
+        offset = int(query.Offset) if Text.isInt(query.Offset) else 0
+        limit = int(query.Limit) if Text.isInt(query.Limit) else WebApi.vocabularyPageSize
+        offset = max(offset, 0)
+        limit = min(max(limit, 1), WebApi.vocabularyPageSizeLimit)
+        sort = query.Sort if query.Sort in Vocabulary.sorts else ""
+        order = "desc" if query.Order.lower() == "desc" else "asc"
+        vocabulary = WebApi.__getSortedVocabulary(projectID, sort, order)
+        if vocabulary is None:
+            return {"Error": True, "Message": "Project ID does not exist: {0}".format(projectID)}
+        page = vocabulary[offset:offset + limit].toDicts()
+        result = {
+            "Error": False,
+            "ProjectID": projectID,
+            "Offset": offset,
+            "Limit": limit,
+            "Sort": sort,
+            "Order": order,
+            "VocabularyCnt": len(vocabulary),
+            "Vocabulary": page
+        }
+        if Text.isTrue(query.Html):
+            result["Html"] = WebTemplate.render("VocabularyRows", {"vocabulary": page})
+        content = json.dumps(result)
+        return WebApi.__respondCached({
+            "Content": content,
+            "ETag": WebApiCache.getETag(content),
+            "LastModified": email.utils.formatdate(usegmt=True),
+            "Version": None})
 
     @bottle.route("/Api/GetProjectDetails", method=["GET","POST"])
     @bottle.route("/Api/GetProjectDetails/<projectID>", method=["GET","POST"])
     def getProjectDetails(projectID=None):
         if projectID == None:
-            return WebApi.__run(Database.getAllProjectDetails)
-        if WebApi.__exists(projectID):
-            return WebApi.__run(Database.getProjectDetails, projectID)
-        return {"Error": True, "Message": "Project ID does not exist: {0}".format(projectID)}
-
+            return WebApi.__runCached("GetProjectDetails", Database.getAllProjectDetails)
+        return WebApi.__runCached("GetProjectDetails", Database.getProjectDetails, projectID)
@@ -13,10 +13,11 @@ class Nltk(Interface):
         percentage = float(self.getPluginParamValue("Percentage")) / 100.0
         minCharLength = int(self.getPluginParamValue("MinCharLength"))
         posFilter = self.getPluginParamValue("POS")
-        inputContent = self.getInputContent().lower()
         punctuation = string.punctuation.replace("-", "")
         puncFilter = dict((ord(char), None) for char in punctuation)
-        tokens = nltk.word_tokenize(inputContent.translate(puncFilter))
+        tokens = []
+        for paragraph in self.iterInputParagraphs():
+            tokens.extend(nltk.word_tokenize(paragraph.lower().translate(puncFilter)))
         tokensCnt = len(tokens)
         if tokensCnt < 1:
             self.raiseException("No words found")
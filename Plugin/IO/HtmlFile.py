@@ -1,56 +1,103 @@
 from Plugin.Interface import Interface
-import re
+import itertools
+import os
+from Core.File import File
+from Core.Result import Result
 
 class HtmlFile(Interface):
 
+    __ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\"": "&quot;", "'": "&#x27;"})
+    __ESCAPE_AND_ANNOTATE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\"": "&quot;", "'": "&#x27;",
+                                           "{": "<span class=\"l2\">", "}": "</span>"})
+    __TEMPLATE = None
+
     def __init__(self, cfg, pluginParams, workflowPluginParams, frameworkParams):
         super(HtmlFile, self).__init__(cfg, pluginParams, workflowPluginParams, frameworkParams)
 
+    def __deletePages(self, pages):
+        path = self.__getPagesPath()
+        if File.exists(path):
+            for page in File.getContent(path, asJson=True):
+                if page not in pages:
+                    File.delete(page)
+        File.setContent(path, pages, asJson=True)
+
+    def __getPageName(self, number):
+        if number == 1:
+            return os.path.basename(self.getWorkflowTarget())
+        name, extension = os.path.splitext(os.path.basename(self.getWorkflowTarget()))
+        return "{0}-{1}{2}".format(name, number, extension)
+
+    def __getPagesPath(self):
+        return "{0}/HtmlFilePages.json".format(File.getDirectory(self.getFrameworkParamValue("outputPath")))
+
+    def __getTemplate(self):
+        if HtmlFile.__TEMPLATE is None:
+            path = "{0}/__HtmlFile/Page.html".format(
+                os.path.dirname(os.path.realpath(__file__)).replace('\\', '/'))
+            header, footer = File.getContent(path).split("{{Body}}")
+            HtmlFile.__TEMPLATE = (header.replace("{{Title}}", "Welcome to Cocostats"), footer)
+        return HtmlFile.__TEMPLATE
+
+    def __iterLines(self):
+        path = self.getFrameworkParamValue("translatorPath")
+        vocabulary = Result.getTranslatorVocabulary(path)
+        for line in Result.iterTranslatorL1L2(path):
+            yield "L1L2", line.translate(HtmlFile.__ESCAPE_AND_ANNOTATE)
+        for section in ["L1", "L2"]:
+            for line in Result.iterLinesStripped(Result.iterTranslatorSection(path, "[{0}]".format(section))):
+                yield section, line.translate(HtmlFile.__ESCAPE)
+        for token in vocabulary:
+            yield "VOCABULARY", token.translate(HtmlFile.__ESCAPE)
+
+    def __iterLinesAndWritePages(self, linesPerPage, pages):
+        page = []
+        for line in self.__iterLines():
+            if len(page) >= linesPerPage:
+                pages.append(self.__writePage(page, len(pages) + 1, True))
+                page = []
+            page.append(line)
+            yield line
+        pages.append(self.__writePage(page, len(pages) + 1, False))
+
+    def __iterPage(self, lines, number=None, hasNext=False):
+        header, footer = self.__getTemplate()
+        yield header
+        current = None
+        for section, line in lines:
+            if section != current:
+                if current is not None:
+                    yield "</pre>\n\n"
+                yield "<h2>[{0}]</h2>\n<pre>".format(section)
+                current = section
+            else:
+                yield "\n"
+            yield line
+        if current is not None:
+            yield "</pre>\n"
+        if number is not None:
+            yield "<p class=\"pages\">"
+            if number > 1:
+                yield "<a href=\"{0}\">Previous</a>".format(self.__getPageName(number - 1).translate(HtmlFile.__ESCAPE))
+            yield "<span>Page {0}</span>".format(number)
+            if hasNext:
+                yield "<a href=\"{0}\">Next</a>".format(self.__getPageName(number + 1).translate(HtmlFile.__ESCAPE))
+            yield "</p>\n"
+        yield footer
+
     def runOutput(self):
-        tc = self.getTranslatorContentAsJson()
-        tc["L1L2"] = re.sub("{","<span class=\"L2\">", tc["L1L2"])
-        tc["L1L2"] = re.sub("}","</span>", tc["L1L2"])
-
-        content = """<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <title>Welcome to Cocostats</title>
-    <style>
-        body {{
-            color: #000000;
-            font-family: "Arial", "Helvetica";
-            font-size: 14px;
-            letter-spacing: 1px;
-        }}
-        pre {{
-            color: inherit;
-            font-family: inherit;
-            font-size: inherit;
-            letter-spacing: inherit;
-        }}
-        .l2 {{
-            color: blue;
-            font-weight: bold;
-            font-style: italic;
-        }}
-    </style>
-</head>
-<body>
-<h1>COCOSCATS</h1>
-<h2>[L1L2]</h2>
-{0}
-
-<h2>[L1]</h2>
-{1}
-
-<h2>[L2]</h2>
-{2}
-
-<h2>[VOCABULARY]</h2>
-<pre>{3}</pre>
-
-</body>
-</html>
-""".format(tc["L1L2"].strip(), tc["L1"], tc["L2"], "\n".join(tc["Vocabulary"]))
-        self.setOutputContent(content)
-        return content
\ No newline at end of file
+        linesPerPage = self.getPluginParamValueAsInt("LinesPerPage", 0)
+        if linesPerPage < 1:
+            self.setOutputContentFromChunks(self.__iterPage(self.__iterLines()))
+            self.__deletePages([])
+            return None
+        pages = []
+        self.setOutputContentFromChunks(self.__iterPage(self.__iterLinesAndWritePages(linesPerPage, pages)),
+                                        copyToTarget=False)
+        self.__deletePages(pages[1:])
+        return None
+
+    def __writePage(self, lines, number, hasNext):
+        path = "{0}/{1}".format(File.getDirectory(self.getWorkflowTarget()), self.__getPageName(number))
+        File.setContentFromChunks(path, self.__iterPage(lines, number, hasNext), mkdirs=True)
+        return path
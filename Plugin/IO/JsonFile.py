@@ -1,20 +1,90 @@
 from Plugin.Interface import Interface
-import base64
 import json
+from Core.Result import Result
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 class JsonFile(Interface):
 
     def __init__(self, cfg, pluginParams, workflowPluginParams, frameworkParams):
         super(JsonFile, self).__init__(cfg, pluginParams, workflowPluginParams, frameworkParams)
+        self.__encodeWithBase64 = False
+        self.__path = None
+        self.__vocabulary = None
+
+    def __encode(self, value):
+        if not self.__encodeWithBase64:
+            return value
+        return Result.encodeBase64(value)
+
+    def __iterCbor(self):
+        if cbor2 is None:
+            self.raiseException("CBOR output requires the cbor2 package")
+        yield b"\xa4"
+        for name in ["L1L2", "L1", "L2"]:
+            yield cbor2.dumps(name)
+            yield cbor2.dumps("".join(self.__iterValue(name)))
+        yield cbor2.dumps("VOCABULARY")
+        yield b"\x9f"
+        for token in self.__vocabulary:
+            yield cbor2.dumps(self.__encode(token))
+        yield b"\xff"
+
+    def __iterJson(self):
+        for name in ["L1L2", "L1", "L2"]:
+            yield "{0}{1}: \"".format("{" if name == "L1L2" else ", ", json.dumps(name))
+            for chunk in self.__iterValue(name):
+                yield json.dumps(chunk)[1:-1]
+            yield "\""
+        yield ", \"VOCABULARY\": ["
+        separator = ""
+        for token in self.__vocabulary:
+            yield separator
+            yield json.dumps(self.__encode(token))
+            separator = ", "
+        yield "]}"
+
+    def __iterMessagePack(self):
+        if msgpack is None:
+            self.raiseException("MessagePack output requires the msgpack package")
+        packer = msgpack.Packer()
+        yield packer.pack_map_header(4)
+        for name in ["L1L2", "L1", "L2"]:
+            yield packer.pack(name)
+            yield packer.pack("".join(self.__iterValue(name)))
+        yield packer.pack("VOCABULARY")
+        yield packer.pack_array_header(len(self.__vocabulary))
+        for token in self.__vocabulary:
+            yield packer.pack(self.__encode(token))
+
+    def __iterNDJson(self):
+        for token in self.__vocabulary:
+            l1, l2, pos, cnt = Result.parseVocabularyToken(token)
+            yield json.dumps({"L1": self.__encode(l1), "L2": self.__encode(l2),
+                              "Pos": self.__encode(pos), "Cnt": self.__encode(cnt)})
+            yield "\n"
+
+    def __iterValue(self, name):
+        return Result.iterTranslatorValue(self.__path, name, self.__encodeWithBase64)
 
     def runOutput(self):
-        tc = self.getTranslatorContentAsJson()
-        if self.getPluginParamValueAsTrueOrFalse("EncodeWithBase64"):
-            tc["l1l2"] = str(base64.b64encode(bytes(tc["l1l2"], "utf-8")))
-            tc["l1"] = str(base64.b64encode(bytes(tc["l1"], "utf-8")))
-            tc["l2"] = str(base64.b64encode(bytes(tc["l1"], "utf-8")))
-            for i in range(0, len(tc["Wordlist"])):
-                tc["Vocabulary"][i] = str(base64.b64encode(bytes(tc["Vocabulary"][i], "utf-8")))
-        content = {"L1L2": tc["L1L2"], "L1": tc["L1"], "L2": tc["L2"], "VOCABULARY": tc["Vocabulary"]}
-        self.setOutputContent(json.dumps(content))
-        return content
\ No newline at end of file
+        writers = {
+            "cbor": self.__iterCbor,
+            "json": self.__iterJson,
+            "messagepack": self.__iterMessagePack,
+            "ndjson": self.__iterNDJson
+        }
+        outputFormat = self.getPluginParamValue("Format", "Json").lower()
+        if outputFormat not in writers:
+            self.raiseException("Unknown JSON output format: {0}".format(outputFormat))
+        self.__encodeWithBase64 = self.getPluginParamValueAsTrueOrFalse("EncodeWithBase64")
+        self.__path = self.getFrameworkParamValue("translatorPath")
+        self.__vocabulary = Result.getTranslatorVocabulary(self.__path)
+        self.setOutputContentFromChunks(writers[outputFormat]())
+        return None
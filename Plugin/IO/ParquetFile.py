@@ -0,0 +1,21 @@
+from Plugin.Interface import Interface
+from Core.File import File
+from Core.Parquet import Parquet
+from Core.Result import Result
+
+class ParquetFile(Interface):
+
+    def __init__(self, cfg, pluginParams, workflowPluginParams, frameworkParams):
+        super(ParquetFile, self).__init__(cfg, pluginParams, workflowPluginParams, frameworkParams)
+
+    def runOutput(self):
+        vocabulary = Result.getTranslatorVocabularyEntries(self.getFrameworkParamValue("translatorPath"))
+        path = File.getTempPath(self.getFrameworkParamValue("outputPath"))
+        try:
+            Parquet.write(path, Parquet.iterVocabularyRows(self.getProjectID(), vocabulary),
+                          self.getPluginParamValue("Compression", "Zstd"),
+                          self.getPluginParamValueAsInt("RowGroupSize", Parquet.rowGroupSize))
+            self.setOutputContentFromChunks(File.iterChunks(path, asBytes=True))
+        finally:
+            File.delete(path)
+        return None
@@ -1,5 +1,6 @@
 from Plugin.Interface import Interface
 from Core.File import File
+from Core.Result import Result
 
 class TextFile(Interface):
 
@@ -11,6 +12,10 @@ class TextFile(Interface):
         self.setInputContent(content)
         return content
 
+    def runInputStreaming(self):
+        self.setInputContentFromChunks(File.iterChunks(self.getWorkflowSource()))
+        return None
+
     def runOutput(self):
         tc = self.getTranslatorContentAsJson()
         content = """
@@ -27,4 +32,29 @@ class TextFile(Interface):
 {3}
 """.format(tc["L1L2"], tc["L1"], tc["L2"], "\n".join(tc["Vocabulary"])).strip()
         self.setOutputContent(content)
-        return content
\ No newline at end of file
+        return content
+
+    def runOutputStreaming(self):
+        self.setOutputContentFromChunks(self.__iterOutput())
+        return None
+
+    def __iterLines(self, lines):
+        separator = ""
+        for line in lines:
+            yield separator
+            yield line
+            separator = "\n"
+
+    def __iterOutput(self):
+        path = self.getFrameworkParamValue("translatorPath")
+        vocabulary = Result.getTranslatorVocabulary(path)
+        yield "[L1L2]\n"
+        yield from self.__iterLines(Result.iterTranslatorL1L2(path))
+        yield "\n\n[L1]\n"
+        yield from self.__iterLines(Result.iterLinesStripped(Result.iterTranslatorSection(path, "[L1]")))
+        yield "\n\n[L2]\n"
+        yield from self.__iterLines(Result.iterLinesStripped(Result.iterTranslatorSection(path, "[L2]")))
+        yield "\n\n[VOCABULARY]"
+        for token in vocabulary:
+            yield "\n"
+            yield token
@@ -1,22 +1,50 @@
 from Plugin.Interface import Interface
-import base64
+import io
+from xml.sax.saxutils import XMLGenerator
+from Core.Result import Result
 
 class XmlFile(Interface):
 
     def __init__(self, cfg, pluginParams, workflowPluginParams, frameworkParams):
         super(XmlFile, self).__init__(cfg, pluginParams, workflowPluginParams, frameworkParams)
+        self.__encodeWithBase64 = False
+
+    def __encode(self, value):
+        if not self.__encodeWithBase64:
+            return value
+        return Result.encodeBase64(value)
+
+    def __iterXml(self):
+        path = self.getFrameworkParamValue("translatorPath")
+        vocabulary = Result.getTranslatorVocabulary(path)
+        buffer = io.StringIO()
+        xml = XMLGenerator(buffer, encoding="UTF-8", short_empty_elements=True)
+        def flush():
+            content = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return content
+        xml.startDocument()
+        xml.startElement("CONTENT", {})
+        for name in ["L1L2", "L1", "L2"]:
+            xml.startElement(name, {})
+            for chunk in Result.iterTranslatorValue(path, name, self.__encodeWithBase64):
+                xml.characters(chunk)
+                yield flush()
+            xml.endElement(name)
+        xml.startElement("VOCABULARY", {})
+        for token in vocabulary:
+            l1, l2, pos, cnt = Result.parseVocabularyToken(token)
+            xml.startElement("Word", {"L1": self.__encode(l1), "L2": self.__encode(l2),
+                                      "Pos": self.__encode(pos), "Cnt": self.__encode(cnt)})
+            xml.endElement("Word")
+            yield flush()
+        xml.endElement("VOCABULARY")
+        xml.endElement("CONTENT")
+        xml.endDocument()
+        yield flush()
 
     def runOutput(self):
-        tc = self.getTranslatorContentAsJson()
-        if self.getPluginParamValueAsTrueOrFalse("EncodeWithBase64"):
-            tc["l1l2"] = str(base64.b64encode(bytes(tc["l1l2"], "utf-8")))
-            tc["l1"] = str(base64.b64encode(bytes(tc["l1"], "utf-8")))
-            tc["l2"] = str(base64.b64encode(bytes(tc["l1"], "utf-8")))
-            for i in range(0, len(tc["Wordlist"])):
-                tc["Vocabulary"][i] = str(base64.b64encode(bytes(tc["Vocabulary"][i], "utf-8")))
-        content = """<?xml version="1.0" encoding="UTF-8"?>
-<CONTENT><L1L2>{0}</L1L2><L1>{1}</L1><L2>{2}</L2><VOCABULARY>{3}</VOCABULARY></CONTENT>
-""".format(tc["L1L2"].strip(), tc["L1"], tc["L2"], tc["Vocabulary"])
-        content = content.strip()
-        self.setOutputContent(content)
-        return content
\ No newline at end of file
+        self.__encodeWithBase64 = self.getPluginParamValueAsTrueOrFalse("EncodeWithBase64")
+        self.setOutputContentFromChunks(self.__iterXml())
+        return None
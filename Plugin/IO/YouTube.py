@@ -4,6 +4,7 @@ import httplib2
 import os
 import re
 import sys
+import threading
 from urllib.parse import urlparse
 from apiclient.discovery import build_from_document
 from apiclient.errors import HttpError
@@ -11,10 +12,65 @@ from oauth2client.client import flow_from_clientsecrets
 from oauth2client.file import Storage
 from oauth2client.tools import argparser, run_flow
 from Core.File import File
+from Core.Result import Result
+from Core.Subtitle import Subtitle
 from Core.Text import Text
 # Reference: https://developers.google.com/youtube/v3/guides/authenticatio
 # https://developers.google.com/api-client-library/python/guide/aaa_client_secrets
 
+class YouTubeClient(object):
+    __credentials = {}
+    __documents = {}
+    __local = threading.local()
+    __lock = threading.Lock()
+
+    @staticmethod
+    def clear():
+        with YouTubeClient.__lock:
+            YouTubeClient.__credentials.clear()
+            YouTubeClient.__documents.clear()
+        YouTubeClient.__local.services = {}
+
+    @staticmethod
+    def __getCredentials(credentialsPath, getCredentials):
+        with YouTubeClient.__lock:
+            credentials = YouTubeClient.__credentials.get(credentialsPath)
+        if credentials is None or credentials.invalid:
+            credentials = getCredentials()
+            with YouTubeClient.__lock:
+                YouTubeClient.__credentials[credentialsPath] = credentials
+        elif credentials.access_token_expired:
+            credentials.refresh(httplib2.Http())
+        return credentials
+
+    @staticmethod
+    def getDocument(path, endpoint=None):
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size, endpoint)
+        document = YouTubeClient.__documents.get(key)
+        if document is None:
+            document = File.getContent(path, asJson=True)
+            if endpoint:
+                endpoint = "{0}/".format(endpoint.rstrip("/"))
+                document["rootUrl"] = endpoint
+                document["baseUrl"] = "{0}{1}".format(endpoint, document.get("servicePath", ""))
+            YouTubeClient.__documents[key] = document
+        return document
+
+    @staticmethod
+    def getService(documentPath, credentialsPath, getCredentials, endpoint=None):
+        credentials = YouTubeClient.__getCredentials(credentialsPath, getCredentials)
+        if not hasattr(YouTubeClient.__local, "services"):
+            YouTubeClient.__local.services = {}
+        key = (documentPath, credentialsPath, endpoint)
+        entry = YouTubeClient.__local.services.get(key)
+        if entry is None or entry["Credentials"] is not credentials:
+            http = credentials.authorize(httplib2.Http())
+            service = build_from_document(YouTubeClient.getDocument(documentPath, endpoint), http=http)
+            entry = {"Credentials": credentials, "Http": http, "Service": service}
+            YouTubeClient.__local.services[key] = entry
+        return entry["Service"]
+
 class YouTubeGoogleCaptionsApiCode(object):
 
     def __init__(self):
@@ -78,6 +134,7 @@ https://developers.google.com/api-client-library/python/guide/aaa_client_secrets
 
         if Text.isTrue(self.__PARAMS["RefreshOAUTH2AccessToken"]):
             File.delete(self.__CLIENT_OAUTH2_ACCESS_TOKEN_FILE)
+            YouTubeClient.clear()
 
         if not File.exists(self.__CLIENT_OAUTH2_ACCESS_TOKEN_FILE):
             self.generateOAUTH2AccessToken()
@@ -113,6 +170,10 @@ https://developers.google.com/api-client-library/python/guide/aaa_client_secrets
 
 
     def get_authenticated_service(self, args):
+        return YouTubeClient.getService(self.__CLIENT_API_CAPTIONS_FILE, self.__CLIENT_OAUTH2_ACCESS_TOKEN_FILE,
+                                        lambda: self.getCredentials(args), self.__PARAMS.get("Endpoint"))
+
+    def getCredentials(self, args):
         flow = flow_from_clientsecrets(self.__CLIENT_SECRETS_FILE,
                                        scope=self.__YOUTUBE_READ_WRITE_SSL_SCOPE,
                                        message=self.__MISSING_CLIENT_SECRETS_MESSAGE)
@@ -120,13 +181,14 @@ https://developers.google.com/api-client-library/python/guide/aaa_client_secrets
         credentials = storage.get()
         if credentials is None or credentials.invalid:
             credentials = run_flow(flow, storage, args)
-        with open(self.__CLIENT_API_CAPTIONS_FILE, "r", encoding="utf-8") as f:
-            doc = f.read()
-            return build_from_document(doc, http=credentials.authorize(httplib2.Http()))
+        return credentials
 
     def getDownloadedCaptions(self):
         return File.getContent(self.__DOWNLOADED_PATH)
 
+    def iterDownloadedCaptions(self):
+        return File.iterLines(self.__DOWNLOADED_PATH)
+
     def list_captions(self):
         args = self.__ARGS_PARSER.parse_known_args()
         youtube = self.get_authenticated_service(args)
@@ -141,8 +203,8 @@ https://developers.google.com/api-client-library/python/guide/aaa_client_secrets
             print ("Caption track '%s(%s)' in '%s' language." % (name, id, language))
         return results["items"]
 
-    def saveTranslatedCaptions(self, content):
-        File.setContent(self.__TRANSLATED_PATH, content)
+    def saveTranslatedCaptions(self, path):
+        File.copy(path, self.__TRANSLATED_PATH)
 
     def setCaptionID(self, captionID=None):
         if captionID is not None:
@@ -206,50 +268,13 @@ class YouTube(Interface):
     def __init__(self, cfg, pluginParams, workflowPluginParams, frameworkParams):
         super(YouTube, self).__init__(cfg, pluginParams, workflowPluginParams, frameworkParams)
 
-    def __parseContentForInputSRT(self, rawContent):
-        content = []
-        newLineTracker = 0
-        for token in rawContent.split("\n"):
-            token = token.strip()
-            if re.search("-->", token) or token.isdigit() or Text.isNothing(token):
-                if newLineTracker < 1:
-                    content.append("")
-                newLineTracker += 1
-            else:
-                content.append(token)
-                newLineTracker = 0
-        content = "\n".join(content).strip()
-        return content
-
-    def __parseContentForOutputSRT(self, rawContent):
-        tc = self.getTranslatorContentAsJson()
-        counters = []
-        markers = []
-        subtitles = []
-        for token in rawContent.split("\n"):
-            token = token.strip()
-            if Text.isNothing(token):
-                continue
-            if token.isdigit():
-                counters.append(token)
-            elif re.search("-->", token):
-                markers.append(token)
-        tc["L1L2"] = tc["L1L2"].strip()
-        subtitle = ""
-        for token in tc["L1L2"].split("\n"):
-            token = token.strip()
-            if Text.isNothing(token):
-                subtitles.append(subtitle)
-                subtitle = ""
-            else:
-                subtitle = "{0}\n{1}".format(subtitle, token)
-        subtitles.append(subtitle)
-        content = ""
-        for i in range(0, len(counters)):
-            content = "{0}\n{1}\n{2}{3}\n".format(
-                content, counters[i], markers[i], subtitles[i])
-        content = content.lstrip()
-        return content
+    def __iterContentForInput(self, lines):
+        return Subtitle.iterText(Subtitle.iterCues(lines))
+
+    def __iterContentForOutput(self, lines, subtitleFormat):
+        path = self.getFrameworkParamValue("translatorPath")
+        blocks = Subtitle.iterBlocks(Result.iterTranslatorL1L2(path))
+        return Subtitle.iterContent(Subtitle.iterTranslated(Subtitle.iterCues(lines), blocks), subtitleFormat)
 
     def __parseURL(self, url):
         u = urlparse(url)
@@ -284,6 +309,7 @@ class YouTube(Interface):
         params = {
             "CaptionID": None,
             "CaptionName": self.getPluginParamValue("CaptionName"),
+            "Endpoint": self.getPluginParamValue("Endpoint", ""),
             "Format": self.getPluginParamValue("Format"),
             "IsDraft": Text.isTrue(self.getPluginParamValue("IsDraft")),
             "L1": self.getPluginParamValue("L1"),
@@ -297,28 +323,25 @@ class YouTube(Interface):
         return api
 
     def runInputUsingLocalFile(self):
-        target = self.getWorkflowSource()
-        rawContent = File.getContent(target)
-        return self.__parseContentForInputSRT(rawContent)
+        self.setInputContentFromChunks(self.__iterContentForInput(File.iterLines(self.getWorkflowSource())))
+        return None
 
     def runInputUsingRemoteFile(self):
         api = self.__runSetup()
-        rawContent = api.downloadCaption()
-        content = self.__parseContentForInputSRT(rawContent)
-        self.setInputContent(content)
-        return content
+        api.downloadCaption()
+        self.setInputContentFromChunks(self.__iterContentForInput(api.iterDownloadedCaptions()))
+        return None
 
     def runOutputUsingLocalFile(self):
-        rawContent = File.getContent(self.getWorkflowSource())
-        content = self.__parseContentForOutputSRT(rawContent)
-        self.setOutputContent(content)
-        return content
+        source = self.getWorkflowSource()
+        self.setOutputContentFromChunks(
+            self.__iterContentForOutput(File.iterLines(source), Subtitle.getFormat(source)))
+        return None
 
     def runOutputUsingRemoteFile(self):
         api = self.__runSetup()
-        rawContent = api.getDownloadedCaptions()
-        content = self.__parseContentForOutputSRT(rawContent)
-        api.saveTranslatedCaptions(content)
+        self.setOutputContentFromChunks(
+            self.__iterContentForOutput(api.iterDownloadedCaptions(), self.getPluginParamValue("Format")))
+        api.saveTranslatedCaptions(self.getFrameworkParamValue("outputPath"))
         api.updateCaption()
-        self.setOutputContent(content)
-        return content
\ No newline at end of file
+        return None
@@ -1,3 +1,4 @@
+from Core.Blob import Blob
 from Core.Database import Database
 from Core.Error import Error
 from Core.File import File
@@ -52,11 +53,13 @@ class Interface(object):
     def getOutputContentDB(self):
         return Database.getOutputContent(self.getProjectID())
 
-    def getPluginParamValue(self, name):
+    def getPluginParamValue(self, name, default=None):
+        if default is not None and name not in self.__pluginParams:
+            return default
         return self.__pluginParams[name]
 
-    def getPluginParamValueAsInt(self, name):
-        return int(self.getPluginParamValue(name))
+    def getPluginParamValueAsInt(self, name, default=None):
+        return int(self.getPluginParamValue(name, default))
 
     def getPluginParamValueAsTrueOrFalse(self, name):
         return Text.toTrueOrFalse(self.getPluginParamValue(name))
@@ -71,7 +74,7 @@ class Interface(object):
         return self.__getContent("translatorPath")
 
     def getTranslatorContentAsJson(self):
-        return Result.parseTranslatorContent(self.getTranslatorContent())
+        return Result.getTranslatorContentParsed(self.__frameworkParams["translatorPath"])
 
     def getTranslatorContentFromDatabase(self):
         return Database.getTranslatorContent(self.getProjectID())
@@ -94,6 +97,12 @@ class Interface(object):
     def handleException(msg, showStackTraceFlag=True, abortFlag=True):
         Error.handleException(msg, showStackTraceFlag, abortFlag)
 
+    def iterInputLines(self):
+        return File.iterLines(self.__frameworkParams["inputPath"])
+
+    def iterInputParagraphs(self):
+        return File.iterParagraphs(self.__frameworkParams["inputPath"])
+
     def raiseException(self, msg):
         Error.raiseException(msg)
 
@@ -101,17 +110,29 @@ class Interface(object):
         return self.__setContent("analyzerPath", content)
 
     def __setContent(self, outputType, content):
-        return File.setContent(self.__frameworkParams[outputType], content)
+        return Blob.setContent(self.__frameworkParams[outputType], content)
+
+    def __setContentFromChunks(self, outputType, chunks):
+        return Blob.setContentFromChunks(self.__frameworkParams[outputType], chunks)
 
     def setInputContent(self, content):
         return self.__setContent("inputPath", content)
 
+    def setInputContentFromChunks(self, chunks):
+        return self.__setContentFromChunks("inputPath", chunks)
+
     def setOutputContent(self, content):
         content = self.__setContent("outputPath", content)
         path = self.getWorkflowTarget()
         File.copy(self.__frameworkParams["outputPath"], path, mkdirs=True)
         return content
 
+    def setOutputContentFromChunks(self, chunks, copyToTarget=True):
+        digest = self.__setContentFromChunks("outputPath", chunks)
+        if copyToTarget:
+            File.copy(self.__frameworkParams["outputPath"], self.getWorkflowTarget(), mkdirs=True)
+        return digest
+
     def setTranslatorContent(self, content):
         return self.__setContent("translatorPath", content)
 
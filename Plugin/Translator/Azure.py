@@ -4,6 +4,7 @@ import os
 import re
 import requests
 from xml.etree import ElementTree
+from Core.Result import Result
 
 class Azure(Interface):
 
@@ -76,7 +77,7 @@ inputContent, translatedInputContent)
         for token in analyzerContentTokens:
             l1b, pos, freq = token.strip().split(",")
             if l1 == l1b:
-                match = "{0},{1},{2},{3}".format(l1, l2, pos, freq)
+                match = Result.formatVocabularyToken(l1, l2, pos, freq)
                 break
         if match is None:
             self.raiseException("Missing analyzer token somewhere")
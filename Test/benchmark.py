@@ -0,0 +1,118 @@
+import argparse
+import os
+import socket
+import ssl
+import sys
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+import bottle
+import shutil
+import tempfile
+from Core.Cocoscats import Cocoscats
+from Core.File import File
+from Core.Framework import Framework
+from Core.Security import Security
+from Core.Web import WebSecurity
+
+def benchmarkHandshake(count, host="127.0.0.1"):
+    if not Security.certsAndKeysExist():
+        Security.createCertsAndKeys(host, "ECDSA")
+    app = bottle.Bottle()
+    app.route("/", callback=lambda: "")
+    sock = socket.socket()
+    sock.bind((host, 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    server = WebSecurity(host=host, port=port)
+    server.quiet = True
+    threading.Thread(target=server.run, args=(app,), daemon=True).start()
+    time.sleep(0.5)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.maximum_version = ssl.TLSVersion.TLSv1_2
+    results = {}
+    for name, resume in [("Full", False), ("Resumed", True)]:
+        session = None
+        resumed = 0
+        start = time.perf_counter()
+        for i in range(count):
+            with socket.create_connection((host, port)) as raw:
+                raw.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with context.wrap_socket(raw, session=session if resume else None) as tls:
+                    if tls.session_reused:
+                        resumed += 1
+                    session = tls.session
+                    tls.sendall(b"GET / HTTP/1.0\r\n\r\n")
+                    while tls.recv(4096):
+                        pass
+        elapsed = time.perf_counter() - start
+        results[name] = {"PerSecond": count / elapsed, "Resumed": resumed}
+    server._server.shutdown()
+    return results
+
+def benchmarkInitialize(count, cfgPath):
+    manifestPath = "{0}/PluginManifest.json".format(Framework.getDataDir())
+    if os.path.isfile(manifestPath):
+        os.remove(manifestPath)
+    results = {}
+    start = time.perf_counter()
+    Cocoscats(cfgPath).initialize()
+    results["Cold"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(count):
+        Cocoscats(cfgPath).initialize()
+    results["Warm"] = (time.perf_counter() - start) / count
+    return results
+
+def benchmarkWrite(count, size):
+    content = ("Cocoscats " * 102 + "\n") * (size * 1024)
+    megabytes = len(content) / (1024 * 1024)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = "{0}/output.txt".format(directory)
+        for durability in ["None", "Flush", "Fsync"]:
+            start = time.perf_counter()
+            for i in range(count):
+                File.setContent(path, content, durability=durability)
+            results["Write{0}".format(durability)] = megabytes * count / (time.perf_counter() - start)
+        copyPath = "{0}/target.txt".format(directory)
+        start = time.perf_counter()
+        for i in range(count):
+            shutil.copyfile(path, copyPath)
+        results["CopyFile"] = megabytes * count / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for i in range(count):
+            File.copy(path, copyPath)
+        results["Copy"] = megabytes * count / (time.perf_counter() - start)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser( \
+        prog=os.path.basename(__file__),
+        description="Cocoscats benchmarks",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("-c", "--cfg", default="{0}/test.json".format(Framework.getTestDir()),
+                        help="Cfg file used by --initialize")
+    parser.add_argument("-I", "--initialize", action="store_true",
+                        help="Measure Cocoscats.initialize() with a cold and warm plugin manifest")
+    parser.add_argument("-n", "--count", type=int, default=200,
+                        help="Number of iterations")
+    parser.add_argument("-s", "--size", type=int, default=64,
+                        help="Output size in MB used by --write")
+    parser.add_argument("-T", "--handshake", action="store_true",
+                        help="Measure TLS handshakes per second against localhost")
+    parser.add_argument("-W", "--write", action="store_true",
+                        help="Measure File.setContent and File.copy throughput for large outputs")
+    args = parser.parse_args()
+    if args.handshake:
+        for name, result in benchmarkHandshake(args.count).items():
+            print("{0:10} {1:10.1f} handshakes/s ({2} resumed)".format(
+                name, result["PerSecond"], result["Resumed"]))
+    if args.initialize:
+        for name, elapsed in benchmarkInitialize(args.count, args.cfg).items():
+            print("{0:10} {1:10.3f} ms".format(name, elapsed * 1000))
+    if args.write:
+        for name, result in benchmarkWrite(args.count, args.size).items():
+            print("{0:10} {1:10.1f} MB/s".format(name, result))
@@ -1,15 +1,36 @@
+from beaker.middleware import SessionMiddleware
+import base64
+import glob
+import gzip
+import http.server
+import json
 import os
 import sys
+import threading
 import unittest
 import warnings
+import xml.etree.ElementTree as ElementTree
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
-from Core.Cfg import Cfg, CfgEditor
+from Core.Blob import Blob
+from Core.Cfg import Cfg, CfgEditor, CfgWatcher
 from Core.Cli import Cli
 from Core.Cocoscats import Cocoscats
+from Core.Directory import Directory
 from Core.Error import Error
 from Core.File import File
 from Core.Framework import Framework
 from Core.Msg import Msg
+from Core.Parquet import Parquet
+from Core.Result import Result
+from Core.Subtitle import Subtitle
+from Core.Vocabulary import Vocabulary, VocabularyEntry
+from Core.Web import Web, WebAsset, WebCompression, WebTemplate
+from Plugin.IO.HtmlFile import HtmlFile
+from Plugin.IO.JsonFile import JsonFile
+from Plugin.IO.ParquetFile import ParquetFile
+from Plugin.IO.TextFile import TextFile
+from Plugin.IO.XmlFile import XmlFile
+from Plugin.IO.YouTube import YouTube, YouTubeClient
 
 class Test(unittest.TestCase):
 
@@ -19,11 +40,37 @@ class Test(unittest.TestCase):
         self.databasePath = "{0}/{1}".format(Framework.getDataDir(), self.databaseName)
         self.cfgPath = "{0}/test.json".format(self.testDir)
         self.tmpCfgPath = "{0}/Tmp/tmp.json".format(self.testDir)
+        self.frameworkParams = {
+            "inputPath": "{0}/Tmp/input.txt".format(self.testDir),
+            "translatorPath": "{0}/Tmp/translator.txt".format(self.testDir),
+            "outputPath": "{0}/Tmp/output.txt".format(self.testDir)
+        }
         warnings.simplefilter("ignore", category=DeprecationWarning)
         warnings.simplefilter("ignore", category=ImportWarning)
 
     def tearDown(self):
-        pass
+        File.deletes(list(self.frameworkParams.values()) +
+                     [Result.getTranslatorResultPath(self.frameworkParams["translatorPath"])])
+
+    def getPlugin(self, pluginClass, pluginParams, target, workflowPluginParams={}):
+        workflowPluginParams = dict(workflowPluginParams, __workflowTargetPath__=target)
+        return pluginClass({}, pluginParams, workflowPluginParams, self.frameworkParams)
+
+    def setTranslatorContent(self, vocabulary, l1, l2):
+        File.setContent(self.frameworkParams["translatorPath"],
+                        "[VOCABULARY]\n{0}\n\n[REJECTED]\n\n[L1]\n{1}\n[L2]\n{2}\n".format(
+                            "\n".join(vocabulary), l1, l2))
+
+    def testBlobSetContent(self):
+        paths = ["{0}/Tmp/blob{1}.txt".format(self.testDir, i) for i in range(2)]
+        digests = [Blob.setContent(path, "Cocoscats\n", mkdirs=True) for path in paths]
+        self.assertEqual(digests[0], digests[1])
+        self.assertTrue(os.path.samefile(paths[0], Blob.getPath(digests[0])))
+        File.setContent(paths[0], "Changed")
+        self.assertEqual(File.getContent(paths[1]), "Cocoscats\n")
+        File.deletes(paths)
+        Blob.collectGarbage()
+        self.assertFalse(File.exists(Blob.getPath(digests[0])))
 
     def testCfgLoad(self):
         cfg = Cfg(self.cfgPath)
@@ -36,11 +83,42 @@ class Test(unittest.TestCase):
         cfg.load(False)
         cfg.verify()
 
+    def testCfgLookups(self):
+        cfg = Cfg(self.cfgPath)
+        cfg.load(False)
+        self.assertEqual(cfg.getPlugin("IO", "TextFile")["Name"], "TextFile")
+        self.assertEqual(cfg.getPluginMethod("IO", "TextFile", "runInput")["Name"], "runInput")
+        workflowPlugin = cfg.getWorkflowPlugin("Input")
+        self.assertEqual(workflowPlugin["Alias"], "IO")
+        self.assertNotIn("Alias", cfg.cfg["Workflow"]["Input"])
+        with self.assertRaises(TypeError):
+            cfg.getCfg()["Workflow"]["Input"]["Source"] = None
+
+    def testCfgSchema(self):
+        cfgEditor = CfgEditor()
+        cfgEditor.loadCfg(self.cfgPath)
+        cfgEditor.setProjectID("My Test Project")
+        cfgEditor.saveCfg(self.tmpCfgPath)
+        cfg = Cfg(self.tmpCfgPath)
+        with self.assertRaises(Exception):
+            cfg.load(True)
+
     def testCfgShow(self):
         cfg = Cfg(self.cfgPath)
         cfg.load()
         cfg.show()
 
+    def testCfgWatcher(self):
+        changes = []
+        cfgEditor = CfgEditor()
+        cfgEditor.loadCfg(self.cfgPath)
+        cfgEditor.saveCfg(self.tmpCfgPath)
+        watcher = CfgWatcher(self.tmpCfgPath, lambda: changes.append(True))
+        self.assertFalse(watcher.check())
+        os.utime(self.tmpCfgPath, ns=(0, watcher.mtime + 1))
+        self.assertTrue(watcher.check())
+        self.assertEqual(len(changes), 1)
+
     def testCocoscatsInitialize(self):
         cocoscats = Cocoscats(self.cfgPath)
         cocoscats.initialize()
@@ -123,11 +201,297 @@ class Test(unittest.TestCase):
             cocoscats.initialize()
             Cli.run(cocoscats)
 
+    def testFileIterators(self):
+        path = "{0}/Tmp/paragraphs.txt".format(self.testDir)
+        File.setContentFromChunks(path, ["One\nTwo\n", "\n\nThree\n"])
+        self.assertEqual(list(File.iterLines(path)), ["One", "Two", "", "", "Three"])
+        self.assertEqual(list(File.iterParagraphs(path)), ["One\nTwo", "Three"])
+        self.assertEqual("".join(File.iterChunks(path, 4)), "One\nTwo\n\n\nThree\n")
+        with File.getMap(path) as content:
+            self.assertEqual(content[:3], b"One")
+        File.delete(path)
+
+    def testFileSetContentAndCopy(self):
+        path = "{0}/Tmp/atomic.txt".format(self.testDir)
+        copyPath = "{0}/Tmp/atomicCopy.txt".format(self.testDir)
+        for durability in ["None", "Flush", "Fsync"]:
+            File.setContent(path, durability, durability=durability)
+            File.copy(path, copyPath, durability=durability)
+            self.assertEqual(File.getContent(copyPath), durability)
+        self.assertEqual(len(glob.glob("{0}/Tmp/*.tmp".format(self.testDir))), 0)
+        File.deletes([path, copyPath])
+
     def testFrameworkGetInstallDir(self):
         installDir = Framework.getInstallDir()
         self.assertTrue(
             os.path.isdir(installDir),
             "Incorrect installation directory")
 
+    def testHtmlFileOutput(self):
+        self.setTranslatorContent(["house,rumah,NOUN,2"], "The <house> & garden.\nMy house.", "Rumah itu.")
+        target = "{0}/Tmp/output.html".format(self.testDir)
+        paths = [target] + ["{0}/Tmp/output-{1}.html".format(self.testDir, i) for i in range(2, 8)]
+        File.setContent(paths[6], "Not a page")
+        self.getPlugin(HtmlFile, {}, target).runOutput()
+        self.assertIn("The &lt;<span class=\"l2\">rumah</span>&gt; &amp; garden.", File.getContent(target))
+        self.assertTrue(File.exists(paths[6]))
+        self.getPlugin(HtmlFile, {"LinesPerPage": "1"}, target).runOutput()
+        self.assertTrue(File.exist(paths[:6]))
+        self.assertIn("<span>Page 1</span>", File.getContent(target))
+        self.assertEqual(1, os.stat(paths[1]).st_nlink)
+        self.assertIn("My house.", File.getContent(self.frameworkParams["outputPath"]))
+        self.assertIn("Rumah itu.", File.getContent(self.frameworkParams["outputPath"]))
+        self.getPlugin(HtmlFile, {"LinesPerPage": "2"}, target).runOutput()
+        self.assertTrue(File.exist(paths[:3]))
+        self.assertFalse(File.exists(paths[3]))
+        self.assertIn("href=\"output-3.html\"", File.getContent(paths[1]))
+        self.getPlugin(HtmlFile, {"LinesPerPage": "0"}, target).runOutput()
+        self.assertFalse(File.exists(paths[1]))
+        self.assertEqual("Not a page", File.getContent(paths[6]))
+        File.deletes(paths + ["{0}/Tmp/HtmlFilePages.json".format(self.testDir)])
+
+    def testJsonFileOutput(self):
+        self.setTranslatorContent(["house,rumah,NOUN,2", "green,hijau,ADJ,1"],
+                                  "\n The \"house\" is green.\n\nMy house.\n", "Rumah itu hijau.")
+        tc = Result.parseTranslatorContent(File.getContent(self.frameworkParams["translatorPath"]))
+        target = "{0}/Tmp/output.json".format(self.testDir)
+        self.getPlugin(JsonFile, {"EncodeWithBase64": "False", "Format": "Json"}, target).runOutput()
+        expected = {"L1L2": tc["L1L2"], "L1": tc["L1"], "L2": tc["L2"], "VOCABULARY": tc["Vocabulary"]}
+        self.assertEqual(json.dumps(expected), File.getContent(target))
+        self.getPlugin(JsonFile, {"EncodeWithBase64": "True", "Format": "NDJson"}, target).runOutput()
+        lines = File.getContent(target).splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertEqual("hijau", base64.b64decode(json.loads(lines[1])["L2"]).decode("utf-8"))
+        File.delete(target)
+
+    @unittest.skipIf(not Parquet.isAvailable(), "pyarrow is not installed")
+    def testParquetFileOutput(self):
+        import pyarrow.parquet
+        self.setTranslatorContent(["house,rumah,NOUN,2", "green,hijau,ADJ,1", "cat,kucing,NOUN,3", "Dog,anjing,NOUN,4"],
+                                  "The house is green.", "Rumah itu hijau.")
+        target = "{0}/Tmp/output.parquet".format(self.testDir)
+        self.getPlugin(ParquetFile, {"Compression": "Zstd", "RowGroupSize": "2"}, target,
+                       {"__projectID__": "Test"}).runOutput()
+        parquetFile = pyarrow.parquet.ParquetFile(target)
+        self.assertEqual(2, parquetFile.num_row_groups)
+        self.assertEqual({"Project": ["Test"] * 4, "L1": ["Dog", "cat", "green", "house"],
+                          "L2": ["anjing", "kucing", "hijau", "rumah"], "Pos": ["NOUN", "NOUN", "ADJ", "NOUN"],
+                          "Cnt": [4, 3, 1, 2]},
+                         parquetFile.read().to_pydict())
+        File.delete(target)
+
+    def testSubtitle(self):
+        cues = list(Subtitle.iterCues(["WEBVTT", "", "NOTE skip me", "", "a", "00:01.000 --> 00:02.500 align:start",
+                                       "One", "", "00:00:03.000 --> 00:00:04.000", "Two", "lines"]))
+        self.assertEqual(["a", None], [cue.Identifier for cue in cues])
+        self.assertEqual(["Two", "lines"], cues[1].Text)
+        content = "".join(Subtitle.iterContent(Subtitle.iterTranslated(cues, [["Satu"]]), "srt"))
+        self.assertEqual("1\n00:00:01,000 --> 00:00:02,500\nSatu\n\n2\n00:00:03,000 --> 00:00:04,000\nTwo\nlines\n",
+                         content)
+        self.assertIn("00:01.000 --> 00:02.500 align:start", "".join(Subtitle.iterContent(cues, "vtt")))
+
+    def testTextFileOutputStreaming(self):
+        self.setTranslatorContent(["house,rumah,NOUN,2"], "\n The house is green.\n\nMy house.\n", "Rumah itu hijau.")
+        contents = []
+        for method in ["runOutput", "runOutputStreaming"]:
+            target = "{0}/Tmp/{1}.txt".format(self.testDir, method)
+            getattr(self.getPlugin(TextFile, {}, target), method)()
+            contents.append(File.getContent(target))
+            File.delete(target)
+        self.assertEqual(contents[0], contents[1])
+        self.assertIn("The {rumah} is green.", contents[1])
+
+    def testTranslatorResult(self):
+        path = "{0}/Tmp/translator.txt".format(self.testDir)
+        File.setContent(path, "[VOCABULARY]\nhouse,rumah,NOUN,2\n\"one, two\",\"satu, dua\",NUM,1\n\n"
+                              "[REJECTED]\n\n[L1]\nThe house.\nHouse, house and one, two.\n[L2]\nRumah itu.\n")
+        result = Result.getTranslatorResult(path)
+        self.assertEqual(["house", "one, two"], result["Vocabulary"]["L1"])
+        self.assertEqual([2, 1], result["Vocabulary"]["Cnt"])
+        self.assertTrue(File.exists(Result.getTranslatorResultPath(path)))
+        self.assertEqual(result, Result.getTranslatorResult(path))
+        parsed = Result.getTranslatorContentParsed(path)
+        self.assertEqual("\"one, two\",\"satu, dua\",NUM,1", parsed["Vocabulary"][1])
+        self.assertEqual("The {rumah}.\n{rumah}, {rumah} and {satu, dua}.", parsed["L1L2"])
+        self.assertEqual(parsed["L1L2"], "\n".join(Result.iterTranslatorL1L2(path)))
+        self.assertEqual("The {rumah}, {rumah hijau} and Houses.",
+                         Result.replaceVocabulary("The House, green house and Houses.",
+                                                  {"house": "{rumah}", "green house": "{rumah hijau}"}))
+        File.setContent(path, "[VOCABULARY]\n\n[REJECTED]\n\n[L1]\nNew.\n[L2]\nBaru.\n")
+        self.assertEqual("New.", Result.getTranslatorResult(path)["L1"])
+        File.deletes([path, Result.getTranslatorResultPath(path)])
+
+    def testVocabulary(self):
+        vocabulary = Vocabulary.fromDicts([
+            {"L1": "house", "L2": "rumah", "Pos": "NOUN", "Cnt": "2"},
+            {"L1": "Green", "L2": "hijau", "Pos": "ADJ", "Cnt": "5"},
+            {"L1": "cat", "L2": "kucing", "Pos": "NOUN", "Cnt": "3"}
+        ])
+        self.assertEqual(["cat", "Green", "house"], vocabulary.sort("L1").l1)
+        self.assertEqual([5, 3, 2], vocabulary.sort("Cnt", True).cnt.tolist())
+        self.assertEqual(["cat", "house"], vocabulary.sort("Pos").filter(pos="NOUN").l1)
+        self.assertEqual(VocabularyEntry("cat", "kucing", "NOUN", 3), vocabulary.filter(minCnt=3)[1])
+        self.assertIs(vocabulary.pos[0], vocabulary.pos[2])
+        self.assertEqual(vocabulary.toDicts(), Vocabulary.fromColumns(vocabulary.getColumns()).toDicts())
+        self.assertEqual(2, len(vocabulary[1:]))
+        with self.assertRaisesRegex(Exception, "Invalid vocabulary count 'many' for 'cat'"):
+            Vocabulary.fromDicts([{"L1": "cat", "L2": "kucing", "Pos": "NOUN", "Cnt": "many"}])
+
+    def testWebCompression(self):
+        content = b"Cocoscats " * 1024
+        def app(environ, startResponse):
+            startResponse("200 OK", [("Content-Type", "text/html"),
+                                     ("Content-Length", str(len(content)))])
+            return [content]
+        headers = {}
+        def startResponse(status, responseHeaders, excInfo=None):
+            headers.update(responseHeaders)
+        environ = {"HTTP_ACCEPT_ENCODING": "gzip", "REQUEST_METHOD": "GET"}
+        body = b"".join(WebCompression(app)(environ, startResponse))
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Length", headers)
+        self.assertEqual(gzip.decompress(body), content)
+        body = b"".join(WebCompression(app, minimumSize=len(content) + 1)(environ, startResponse))
+        self.assertEqual(body, content)
+
+    def testWebSessionReadOnly(self):
+        cfgEditor = CfgEditor()
+        cfgEditor.loadCfg(self.cfgPath)
+        cfgEditor.cfg["Web"]["Session"] = "File"
+        cfgEditor.saveCfg(self.tmpCfgPath)
+        Web.cocoscats = Cocoscats(self.tmpCfgPath)
+        Web.cocoscats.initialize()
+        Web.useHttps = True
+        sessionDir = "{0}/Session".format(Framework.getDataDir())
+        sessionDirExists = Directory.exists(sessionDir)
+        def application(environ, startResponse):
+            session = environ["beaker.session"]
+            if environ["PATH_INFO"] == "/Login":
+                session["Authenticated"] = "True"
+                session.save()
+            body = str(session.get("Authenticated")).encode("utf-8")
+            startResponse("200 OK", [("Content-Type", "text/plain")])
+            return [body]
+        app = SessionMiddleware(application, Web.getSessionOptions())
+        headers = []
+        def request(path, cookie=None):
+            environ = {"REQUEST_METHOD": "GET", "PATH_INFO": path, "wsgi.url_scheme": "https"}
+            if cookie is not None:
+                environ["HTTP_COOKIE"] = cookie
+            return b"".join(app(environ, lambda status, responseHeaders, excInfo=None: headers.extend(responseHeaders)))
+        try:
+            request("/Login")
+            cookie = dict((name.lower(), value) for name, value in headers)["set-cookie"].split(";")[0].strip()
+            paths = glob.glob("{0}/**/{1}.cache".format(sessionDir, cookie.split("=", 1)[1]), recursive=True)
+            self.assertEqual(1, len(paths))
+            content = File.getContent(paths[0], asBytes=True)
+            del headers[:]
+            self.assertEqual(b"True", request("/", cookie))
+            self.assertEqual(content, File.getContent(paths[0], asBytes=True))
+            self.assertNotIn("set-cookie", [name.lower() for name, value in headers])
+        finally:
+            if not sessionDirExists:
+                Directory.delete(sessionDir)
+
+    def testWebTemplateRender(self):
+        WebTemplate.compile()
+        self.assertIn("Navigation", WebTemplate.templates)
+        content = WebTemplate.render("Title", {"title": "<Cocoscats>"})
+        self.assertIn("&lt;Cocoscats&gt;", content)
+        with self.assertRaisesRegex(Exception, "Unknown web template: Missing"):
+            WebTemplate.render("Missing")
+        fragment = WebTemplate.renderFragment(("Test",), lambda: content)
+        self.assertIs(fragment, WebTemplate.renderFragment(("Test",), lambda: None))
+        WebTemplate.render("Title", {"title": "Cocoscats"})
+        self.assertIs(fragment, WebTemplate.renderFragment(("Test",), lambda: None))
+        WebAsset.build()
+        footer = WebTemplate.render("Footer", {"year": "2017", "scripts": "",
+            "jqueryUrl": WebAsset.getUrl("Js/Jquery.js"), "jqueryIntegrity": WebAsset.getIntegrity("Js/Jquery.js"),
+            "cocoscatsUrl": WebAsset.getUrl("Js/Cocoscats.js"),
+            "cocoscatsIntegrity": WebAsset.getIntegrity("Js/Cocoscats.js")})
+        self.assertRegex(footer, r"/Web/Js/Jquery\.[0-9a-f]{16}\.js")
+        self.assertIn("integrity=\"sha512-", footer)
+        footer = WebTemplate.render("Footer", {"year": "2017", "scripts": "",
+            "jqueryUrl": "/Web/Js/Jquery.js", "jqueryIntegrity": "",
+            "cocoscatsUrl": "/Web/Js/Cocoscats.js", "cocoscatsIntegrity": ""})
+        self.assertNotIn("integrity", footer)
+
+    def testXmlFileOutput(self):
+        self.setTranslatorContent(["house,rumah,NOUN,2", "\"<b>&, x\",\"\"\"c\"\"\",X,1"],
+                                  "The <house> & garden.", "Rumah itu.")
+        target = "{0}/Tmp/output.xml".format(self.testDir)
+        self.getPlugin(XmlFile, {"EncodeWithBase64": "False"}, target).runOutput()
+        elements = {}
+        words = []
+        for event, element in ElementTree.iterparse(target):
+            if element.tag == "Word":
+                words.append(element.attrib)
+            else:
+                elements[element.tag] = element.text
+        self.assertEqual("The <{rumah}> & garden.", elements["L1L2"])
+        self.assertEqual({"L1": "<b>&, x", "L2": "\"c\"", "Pos": "X", "Cnt": "1"}, words[1])
+        File.delete(target)
+
+    def testYouTubeClient(self):
+        from oauth2client.client import AccessTokenCredentials
+        requests = []
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            def do_GET(self):
+                requests.append((self.path, self.headers.get("Authorization")))
+                body = json.dumps({"items": [{"id": "Caption1"}]}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def log_message(self, *args):
+                pass
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        documentPath = "{0}/Plugin/IO/__YouTube/youtube-v3-api-captions.json".format(Framework.getInstallDir())
+        endpoint = "http://127.0.0.1:{0}".format(server.server_address[1])
+        credentials = []
+        def getCredentials():
+            credentials.append(AccessTokenCredentials("Token", "Cocoscats"))
+            return credentials[-1]
+        try:
+            YouTubeClient.clear()
+            for i in range(2):
+                service = YouTubeClient.getService(documentPath, "Token.json", getCredentials, endpoint)
+                items = service.captions().list(part="snippet", videoId="Video1").execute()["items"]
+                self.assertEqual("Caption1", items[0]["id"])
+            self.assertEqual(1, len(credentials))
+            self.assertEqual(2, len(requests))
+            services = []
+            thread = threading.Thread(target=lambda: services.append(
+                YouTubeClient.getService(documentPath, "Token.json", getCredentials, endpoint)))
+            thread.start()
+            thread.join()
+            self.assertIsNot(service, services[0])
+            self.assertEqual(1, len(credentials))
+            self.assertTrue(requests[0][0].startswith("/youtube/v3/captions"))
+            self.assertEqual("Bearer Token", requests[0][1])
+        finally:
+            YouTubeClient.clear()
+            server.shutdown()
+            server.server_close()
+
+    def testYouTubeLocalFile(self):
+        source = "{0}/captions.srt".format(self.testDir)
+        target = "{0}/Tmp/captions.srt".format(self.testDir)
+        workflowPluginParams = {"__workflowSourcePath__": source}
+        self.getPlugin(YouTube, {}, target, workflowPluginParams).runInputUsingLocalFile()
+        paragraphs = list(File.iterParagraphs(self.frameworkParams["inputPath"]))
+        self.assertEqual(len(list(Subtitle.iterCues(File.iterLines(source)))), len(paragraphs))
+        self.setTranslatorContent(["school,sekolah,NOUN,1"], "\n\n\n".join(paragraphs[:2]), "")
+        self.getPlugin(YouTube, {}, target, workflowPluginParams).runOutputUsingLocalFile()
+        cues = list(Subtitle.iterCues(File.iterLines(target)))
+        self.assertEqual(len(paragraphs), len(cues))
+        self.assertEqual("00:00:12,879", cues[1].Start)
+        self.assertIn("{sekolah}", cues[0].Text[0])
+        self.assertEqual(paragraphs[2], "\n".join(cues[2].Text))
+        File.delete(target)
+
 if __name__ == '__main__':
     unittest.main()
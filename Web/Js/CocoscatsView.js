@@ -1,69 +1,109 @@
 "use strict";
 $(document).ready(function() {
     var projectID = $("#csProjectID").text().trim()
-    $.ajax({
-    type: "POST",
-    url: "/Api/GetProject/" + projectID,
-    contentType: "application/json; charset=utf-8",
-    success: function(response) {
-        if (response["Error"]) {
-            handleError(response["Message"]);
+    var vocabulary = {
+        offset: 0,
+        limit: 200,
+        total: -1,
+        sort: "",
+        order: "asc",
+        loading: false
+    };
+
+    function handleError(errMsg) {
+        $("#csErrMsg").html(errMsg);
+    }
+
+    function markL2(L1L2) {
+        return L1L2.replace(/[{}]/g, function(brace) {
+            return brace === "{" ? "<span class=\"csL2\">{" : "}</span>";
+        });
+    }
+
+    function loadVocabulary() {
+        if (vocabulary.loading || (vocabulary.total >= 0 && vocabulary.offset >= vocabulary.total)) {
+            return;
+        }
+        vocabulary.loading = true;
+        $.ajax({
+            type: "GET",
+            url: "/Api/GetVocabulary/" + projectID,
+            data: {
+                Offset: vocabulary.offset,
+                Limit: vocabulary.limit,
+                Sort: vocabulary.sort,
+                Order: vocabulary.order,
+                Html: "True"
+            },
+            success: function(response) {
+                vocabulary.loading = false;
+                if (response["Error"]) {
+                    handleError(response["Message"]);
+                    return;
+                }
+                vocabulary.total = response["VocabularyCnt"];
+                vocabulary.offset += response["Vocabulary"].length;
+                $("#csVocabularyRows").append(response["Html"]);
+                $("#csVocabularyStatus").text(vocabulary.offset + " of " + vocabulary.total);
+                if (response["Vocabulary"].length > 0 &&
+                    $("#csVocabulary")[0].scrollHeight <= $("#csVocabulary").innerHeight()) {
+                    loadVocabulary();
+                }
+            },
+            error: function(response, txtStatus, errMsg) {
+                vocabulary.loading = false;
+                handleError(errMsg);
+            }
+        });
+    }
+
+    function resetVocabulary(sort) {
+        if (vocabulary.sort === sort) {
+            vocabulary.order = vocabulary.order === "asc" ? "desc" : "asc";
         } else {
-            var L1L2 = response["L1L2"]
-            L1L2 = L1L2.replace(/{/g,"<span class=\"csL2\">{", L1L2);
-            L1L2 = L1L2.replace(/}/g,"</span>}", L1L2);
+            vocabulary.sort = sort;
+            vocabulary.order = sort === "Cnt" ? "desc" : "asc";
+        }
+        vocabulary.offset = 0;
+        vocabulary.total = -1;
+        $("#csVocabularyRows").empty();
+        $("#csVocabulary").scrollTop(0);
+        loadVocabulary();
+    }
+
+    $("#csVocabulary").scroll(function() {
+        var container = $(this);
+        if (container.scrollTop() + container.innerHeight() >= this.scrollHeight - 200) {
+            loadVocabulary();
+        }
+    });
+
+    $(".csSort").click(function() {
+        if (!vocabulary.loading) {
+            resetVocabulary($(this).data("sort"));
+        }
+    });
+
+    $.ajax({
+        type: "GET",
+        url: "/Api/GetProject/" + projectID,
+        data: {Vocabulary: "False"},
+        success: function(response) {
+            if (response["Error"]) {
+                handleError(response["Message"]);
+                return;
+            }
             $("#csTitle").html(response["Title"]);
             $("#csDescription").html(response["Description"]);
-            $("#csL1L2").html(L1L2);
+            $("#csL1L2").html(markL2(response["L1L2"]));
             $("#csL1").html(response["L1"]);
             $("#csL2").html(response["L2"]);
-            var wordCnt = response["VocabularyParsed"].length;
-            if (wordCnt < 1) {
-                return;
-            }
-            var html = "<table align=\"center\">\n<tr>\n";
-            html += "<th>L1</th><th>L2</th><th>PoS</th><th>Count</th>\n";
-            for (var i = 0; i < wordCnt; i++) {
-                var word = response["VocabularyParsed"][i];
-                html += "<tr>\n";
-                html += "<td>" + word["L1"] + "</td>\n";
-                html += "<td id=\"#" + word["L2"] + "\">" + word["L2"] + "</td>\n";
-                html += "<td>" + word["Pos"] + "</td>\n";
-                html += "<td align=\"center\">" + word["Cnt"] + "</td>\n";
-                html += "</tr>\n";
+            if (response["VocabularyCnt"] > 0) {
+                loadVocabulary();
             }
-            html += "</table>\n";
-            $("#csVocabulary").html("<pre>" + html + "</pre>");
+        },
+        error: function(response, txtStatus, errMsg) {
+            handleError(errMsg);
         }
-    },
-    error: function(response, txtStatus, errMsg) {
-        handleError(errMsg);
-    }
+    });
 });
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-});
\ No newline at end of file
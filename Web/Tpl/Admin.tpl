@@ -25,9 +25,15 @@
 <td>RefreshPassword</td>
 <td>{{RefreshPassword}}</td>
 </tr><tr>
+<td>ReloadCfg</td>
+<td>{{ReloadCfg}}</td>
+</tr><tr>
 <td>Reloader</td>
 <td>{{Reloader}}</td>
 </tr><tr>
+<td>Session</td>
+<td>{{Session}}</td>
+</tr><tr>
 <td>UseAuthentication</td>
 <td>{{UseAuthentication}}</td>
 </tr><tr>
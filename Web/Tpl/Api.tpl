@@ -10,6 +10,9 @@ You can call these APIs via the web server.
 </tr><tr>
 <td>Get project metadata</td>
 <td><a href="/Api/GetProjectDetails">[GetProjectDetails/&lt;projectID&gt;]</a></td>
+</tr><tr>
+<td>Get project vocabulary page</td>
+<td><a href="/Api/GetVocabulary">GetVocabulary/&lt;projectID&gt;?Offset=0&amp;Limit=100&amp;Sort=Cnt&amp;Order=desc</a></td>
 </tr>
 </table>
 
@@ -1,7 +1,14 @@
 
-<script src="/Web/Js/Jquery.js" integrity="sha512-3P8rXCuGJdNZOnUx/03c1jOTnMn3rP63nBip5gOP2qmUh5YAdVAvFZ1E+QLZZbC1rtMrQb+mah3AfYW11RUrWA==
-"></script>
-<script src="/Web/Js/Cocoscats.js"></script>
+% if jqueryIntegrity:
+<script src="{{jqueryUrl}}" integrity="{{jqueryIntegrity}}"></script>
+% else:
+<script src="{{jqueryUrl}}"></script>
+% end
+% if cocoscatsIntegrity:
+<script src="{{cocoscatsUrl}}" integrity="{{cocoscatsIntegrity}}"></script>
+% else:
+<script src="{{cocoscatsUrl}}"></script>
+% end
 {{!scripts}}
 <div id="csFooter">
 <hr/>
@@ -3,7 +3,11 @@
 <head>
 <title>Cocoscats: {{title}}</title>
 <meta charset="utf-8">
-<link rel="stylesheet" href="/Web/Css/Cocoscats.css">
+% if cssIntegrity:
+<link rel="stylesheet" href="{{cssUrl}}" integrity="{{cssIntegrity}}">
+% else:
+<link rel="stylesheet" href="{{cssUrl}}">
+% end
 {{meta}}{{css}}{{js}}</head>
 <body>
 <div align="center">
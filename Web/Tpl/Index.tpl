@@ -2,6 +2,6 @@
 <table>
 <tr>
 <td><a href="/Input"><h3>Start Here!</h3></a></td>
-<td><img src="/Web/Img/cocoscats.png" height="69" width="69" alt="Squirrely"></td>
+<td><img src="{{logoUrl}}" height="69" width="69" alt="Squirrely"></td>
 </tr>
 </table>
@@ -1,5 +1,6 @@
 
 <div class="csDiv">
+<div class="csErrMsg">{{message}}</div>
 <form action="/Login" method="post">
 <table align="center">
 <tr>
@@ -15,4 +15,14 @@
 <h3 class="csHeader">L2</h3>
 <div class="csText" id="csL2"></div>
 <h3 class="csHeader">Vocabulary</h3>
-<div class="csText" id="csVocabulary"></div>
+<div class="csText" id="csVocabulary">
+<table align="center">
+<thead>
+<tr>
+<th class="csSort" data-sort="L1">L1</th><th class="csSort" data-sort="L2">L2</th><th class="csSort" data-sort="Pos">PoS</th><th class="csSort" data-sort="Cnt">Count</th>
+</tr>
+</thead>
+<tbody id="csVocabularyRows"></tbody>
+</table>
+</div>
+<div class="csDiv" id="csVocabularyStatus"></div>
@@ -0,0 +1,8 @@
+% for word in vocabulary:
+<tr>
+<td>{{word["L1"]}}</td>
+<td>{{word["L2"]}}</td>
+<td>{{word["Pos"]}}</td>
+<td align="center">{{word["Cnt"]}}</td>
+</tr>
+% end
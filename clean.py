@@ -1,6 +1,7 @@
 import argparse
 import glob
 import os
+from Core.Blob import Blob
 from Core.Cfg import Cfg
 from Core.Directory import Directory
 from Core.Error import Error
@@ -20,6 +21,7 @@ def deleteSafe():
             Directory.delete("{0}/__pycache__".format(path))
             for path in glob.glob("./Test/Tmp/*"):
                 File.delete(File.getCanonicalPath(path))
+        Blob.collectGarbage()
     except Exception as e:
         Error.handleException(e, True)
 
@@ -33,7 +35,8 @@ def deleteProtected(cfgPath):
             "./Vault/Certificate.pem",
             "./Vault/Password.json",
             "./Vault/PrivateKey.pem",
-            "./Vault/PublicKey.pem"]:
+            "./Vault/PublicKey.pem",
+            "./Vault/Session.json"]:
             File.delete(path)
     except Exception as e:
         Error.handleException(e, True)
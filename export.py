@@ -0,0 +1,74 @@
+import argparse
+import html
+import os
+from Core.Cfg import Cfg
+from Core.Database import Database
+from Core.Directory import Directory
+from Core.Error import Error
+from Core.File import File
+from Core.Msg import Msg
+from Core.Parquet import Parquet
+from Core.Vocabulary import Vocabulary
+
+def getVocabulary(projectID):
+    vocabulary = Database.getVocabulary(projectID)
+    if vocabulary is None:
+        return None
+    return Vocabulary.fromDicts([{name: html.unescape(value) if isinstance(value, str) else value
+                                  for name, value in entry.items()} for entry in vocabulary])
+
+def iterVocabularyRows(projectIDs):
+    for projectID in projectIDs:
+        vocabulary = getVocabulary(projectID)
+        if vocabulary is not None:
+            for row in Parquet.iterVocabularyRows(projectID, vocabulary):
+                yield row
+
+def exportVocabulary(cfgPath, targetPath, projectIDs=None, compression="Zstd", rowGroupSize=None):
+    cfg = Cfg(cfgPath)
+    cfg.load(False)
+    Database.setName(cfg.cfg["Database"]["Name"])
+    if not Database.exists():
+        Error.raiseException("Can't find database: {0}".format(Database.path))
+    Database.connect()
+    try:
+        projects = Database.getAllProjectDetails() or []
+        ids = sorted(project["ID"] for project in projects)
+        if projectIDs:
+            ids = [projectID for projectID in ids if projectID in projectIDs]
+        Directory.make(File.getDirectory(targetPath))
+        count = Parquet.write(targetPath, iterVocabularyRows(ids), compression, rowGroupSize)
+    finally:
+        Database.disconnect()
+    Msg.show("Exported {0} vocabulary row(s) from {1} project(s) to {2}".format(count, len(ids), targetPath))
+    return count
+
+if __name__ == "__main__":
+    cfgPath = "cfg.json"
+    parser = argparse.ArgumentParser( \
+        prog=os.path.basename(__file__),
+        description="Export project vocabulary from the Cocoscats database to Parquet",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("-c", "--cfg", metavar="'cfg'", type=str,
+                        default=cfgPath,
+                        help="JSON configuration file")
+    parser.add_argument("-o", "--output", metavar="'output'", type=str,
+                        default="Out/Vocabulary.parquet",
+                        help="Parquet file to write")
+    parser.add_argument("-p", "--project", metavar="'project'", type=str, nargs="+",
+                        help="Only export these project IDs")
+    parser.add_argument("-z", "--compression", metavar="'compression'", type=str,
+                        default="Zstd",
+                        help="Parquet compression: {0}".format(", ".join(Parquet.compressions)))
+    parser.add_argument("-r", "--rows", metavar="'rows'", type=int,
+                        default=Parquet.rowGroupSize,
+                        help="Rows per row group")
+    args = parser.parse_args()
+    if args.cfg:
+        cfgPath = args.cfg
+    if not os.path.isfile(cfgPath):
+        Error.handleError("Can't find JSON configuration file: {0}".format(cfgPath), True)
+    try:
+        exportVocabulary(cfgPath, args.output, args.project, args.compression, args.rows)
+    except Exception as e:
+        Error.handleException(e, True, True)
@@ -1,8 +1,8 @@
 import nltk
 import pip
 
-PACKAGES = ["apiclient", "beaker", "bleach", "bottle", "google-api-python-client",
-            "httplib2", "nltk", "numpy", "passlib", "pony", "requests", "wikiapi"]
+PACKAGES = ["apiclient", "beaker", "bleach", "bottle", "brotli", "cbor2", "google-api-python-client",
+            "httplib2", "msgpack", "nltk", "numpy", "passlib", "pony", "pyarrow", "requests", "wikiapi"]
 
 def installPackages():
     for package in PACKAGES:
@@ -12,8 +12,13 @@ def installPackages():
     nltk.download("universal_tagset")
     #nltk.download("all-nltk")
 
+def buildSubresourceIntegrityManifest():
+    from Core.Web import WebSecurity
+    WebSecurity.getSubresourceIntegrityHashes()
+
 def uninstallPackages():
     NotImplemented
 
 if __name__ == "__main__":
-    installPackages()
\ No newline at end of file
+    installPackages()
+    buildSubresourceIntegrityManifest()
\ No newline at end of file